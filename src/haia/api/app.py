@@ -17,6 +17,7 @@ from haia.api.deps import (
 )
 from haia.api.routes import chat
 from haia.config import settings
+from haia.embedding.cache import EmbeddingCache
 from haia.embedding.ollama_client import OllamaClient
 from haia.embedding.retrieval_service import RetrievalService
 from haia.extraction import ExtractionService
@@ -68,6 +69,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize Ollama client and retrieval service (Session 8 - Memory Retrieval)
     # Graceful degradation: If Ollama unavailable, skip retrieval (conversations still work)
+    retrieval_service = None
     try:
         logger.info(f"Initializing Ollama client at {settings.ollama_base_url}")
         ollama_client = OllamaClient(
@@ -79,6 +81,9 @@ async def lifespan(app: FastAPI):
 
         # Health check Ollama
         if await ollama_client.health_check():
+            # Load the embedding model now so the first retrieval doesn't pay for it
+            await ollama_client.warmup()
+
             logger.info(f"Initializing retrieval service (model: {settings.embedding_model})")
 
             # Load type weights from settings (Session 8 - User Story 3)
@@ -90,6 +95,15 @@ async def lifespan(app: FastAPI):
                 "correction": settings.memory_type_weight_correction,
             }
 
+            # Optional persistent query embedding cache (survives restarts)
+            embedding_cache = None
+            if settings.embedding_cache_path:
+                embedding_cache = EmbeddingCache(
+                    settings.embedding_cache_path,
+                    max_entries=settings.embedding_cache_max_entries,
+                    max_age_seconds=settings.embedding_cache_max_age_days * 86400,
+                )
+
             retrieval_service = RetrievalService(
                 neo4j_service=neo4j_service,
                 ollama_client=ollama_client,
@@ -97,6 +111,7 @@ async def lifespan(app: FastAPI):
                 confidence_weight=0.3,  # 30%
                 recency_weight=0.2,  # 20%
                 type_weights=type_weights,
+                embedding_cache=embedding_cache,
             )
             set_retrieval_service(retrieval_service)
             logger.info("Retrieval service initialized successfully")
@@ -189,6 +204,10 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Backfill worker stopped")
 
+    # Flush buffered memory access tracking before closing Neo4j
+    if retrieval_service is not None:
+        await retrieval_service.close()
+
     await neo4j_service.close()
     logger.info("Neo4j connection closed")
     logger.info("Server shutdown complete")
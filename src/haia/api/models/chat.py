@@ -2,9 +2,11 @@
 
 import time
 import uuid
+from functools import cached_property
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic_core import to_json
 
 
 class ChatMessage(BaseModel):
@@ -32,7 +34,12 @@ class TokenUsage(BaseModel):
 
     prompt_tokens: int = Field(..., ge=0, description="Tokens in the prompt")
     completion_tokens: int = Field(..., ge=0, description="Tokens in the completion")
-    total_tokens: int = Field(..., ge=0, description="Total tokens used")
+
+    @computed_field
+    @property
+    def total_tokens(self) -> int:
+        """Total tokens used (prompt + completion)."""
+        return self.prompt_tokens + self.completion_tokens
 
 
 class ChatCompletionRequest(BaseModel):
@@ -64,6 +71,15 @@ class ChatCompletionRequest(BaseModel):
             raise ValueError("messages array must contain at least one message")
         return v
 
+    @cached_property
+    def message_dicts(self) -> list[dict[str, str]]:
+        """Messages as plain role/content dicts, built once per request.
+
+        Shared by boundary detection and agent history construction; callers
+        must not mutate the returned list or its dicts.
+        """
+        return [{"role": msg.role, "content": msg.content} for msg in self.messages]
+
 
 class Choice(BaseModel):
     """A single choice in the chat completion response (OpenAI format)."""
@@ -162,7 +178,6 @@ class ChatCompletionResponse(BaseModel):
             usage=TokenUsage(
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
-                total_tokens=prompt_tokens + completion_tokens,
             ),
         )
 
@@ -268,6 +283,39 @@ class ChatCompletionChunk(BaseModel):
             ],
         )
 
+    @staticmethod
+    def delta_json(content: str, model: str, chunk_id: str) -> str:
+        """Serialize a content-only delta chunk without building the models.
+
+        Produces the same JSON as ``from_delta(content, model, chunk_id).model_dump_json()``
+        at a fraction of the cost; used for the per-token chunks of a stream,
+        where the values are already known to be valid.
+
+        Args:
+            content: Incremental content to send
+            model: Model identifier
+            chunk_id: Unique ID for this completion (same across all chunks)
+
+        Returns:
+            JSON string of the chunk
+        """
+        return to_json(
+            {
+                "id": chunk_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"role": None, "content": content},
+                        "finish_reason": None,
+                    }
+                ],
+                "usage": None,
+            }
+        ).decode()
+
     @classmethod
     def create_final_chunk(
         cls,
@@ -63,6 +63,16 @@ async def get_conversation_id(
     return hashlib.sha256(fallback_str.encode("utf-8")).hexdigest()[:16]
 
 
+# Display labels for memory types (other types fall back to a title-cased name)
+_MEMORY_TYPE_LABELS: dict[str, str] = {
+    "preference": "Preference",
+    "technical_context": "Technical Context",
+    "decision": "Past Decision",
+    "personal_fact": "Personal Fact",
+    "correction": "Correction",
+}
+
+
 def format_memories_natural_language(retrieval_response) -> str:
     """Format retrieved memories as natural language context for LLM.
 
@@ -83,21 +93,12 @@ def format_memories_natural_language(retrieval_response) -> str:
 
     for result in retrieval_response.results:
         memory = result.memory
-        memory_type_label = memory.memory_type.replace("_", " ").title()
-
-        # Format based on memory type for natural reading
-        if memory.memory_type == "preference":
-            lines.append(f"- **Preference**: {memory.content}")
-        elif memory.memory_type == "technical_context":
-            lines.append(f"- **Technical Context**: {memory.content}")
-        elif memory.memory_type == "decision":
-            lines.append(f"- **Past Decision**: {memory.content}")
-        elif memory.memory_type == "personal_fact":
-            lines.append(f"- **Personal Fact**: {memory.content}")
-        elif memory.memory_type == "correction":
-            lines.append(f"- **Correction**: {memory.content}")
-        else:
-            lines.append(f"- **{memory_type_label}**: {memory.content}")
+
+        # Label based on memory type for natural reading
+        label = _MEMORY_TYPE_LABELS.get(memory.memory_type)
+        if label is None:
+            label = memory.memory_type.replace("_", " ").title()
+        lines.append(f"- **{label}**: {memory.content}")
 
         # Add confidence indicator for medium-confidence memories
         if result.memory.confidence < 0.7:
@@ -133,10 +134,8 @@ async def stream_chat_response(
     completion_tokens = 0
 
     try:
-        # Convert request messages to agent format
-        agent_messages = [
-            {"role": msg.role, "content": msg.content} for msg in request.messages
-        ]
+        # Request messages in agent format (shared with boundary detection)
+        agent_messages = request.message_dicts
 
         # Inject memory context if available
         if memory_context:
@@ -168,13 +167,13 @@ async def stream_chat_response(
                 accumulated_content += content_delta
                 completion_tokens = len(accumulated_content.split())
 
-                # Create and send chunk
-                chunk = ChatCompletionChunk.from_delta(
+                # Serialize and send chunk (skips per-token model construction)
+                chunk_json = ChatCompletionChunk.delta_json(
                     content=content_delta,
                     model=request.model,
                     chunk_id=chunk_id,
                 )
-                yield f"data: {chunk.model_dump_json()}\n\n"
+                yield f"data: {chunk_json}\n\n"
 
         # Send final chunk with usage statistics
         final_chunk = ChatCompletionChunk.create_final_chunk(
@@ -183,7 +182,6 @@ async def stream_chat_response(
             usage=TokenUsage(
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
-                total_tokens=prompt_tokens + completion_tokens,
             ),
         )
         yield f"data: {final_chunk.model_dump_json()}\n\n"
@@ -264,10 +262,8 @@ async def chat_completions(
 
     # Process boundary detection BEFORE agent execution
     try:
-        # Convert request messages to simple dict format for tracker
-        message_dicts = [
-            {"role": msg.role, "content": msg.content} for msg in request.messages
-        ]
+        # Request messages in simple dict format for tracker
+        message_dicts = request.message_dicts
 
         # Check for conversation boundary
         boundary_result = await tracker.process_request(conversation_id, message_dicts)
@@ -333,10 +329,8 @@ async def chat_completions(
         )
 
     try:
-        # Convert request messages to agent format
-        agent_messages = [
-            {"role": msg.role, "content": msg.content} for msg in request.messages
-        ]
+        # Request messages in agent format (shared with boundary detection)
+        agent_messages = request.message_dicts
 
         # Inject memory context if available
         if memory_context:
@@ -115,6 +115,22 @@ class Settings(BaseSettings):
         description="Embedding vector dimensions",
         ge=1,
     )
+    embedding_cache_path: str | None = Field(
+        None,
+        description=(
+            "SQLite file for persisting query embeddings across restarts (unset = disabled)"
+        ),
+    )
+    embedding_cache_max_entries: int = Field(
+        100_000,
+        description="Maximum query embeddings kept in the persistent cache",
+        ge=1,
+    )
+    embedding_cache_max_age_days: float = Field(
+        30.0,
+        description="Days after which persisted query embeddings are evicted",
+        gt=0.0,
+    )
     retrieval_top_k: int = Field(
         10,
         description="Number of memories to retrieve in semantic search",
@@ -9,11 +9,18 @@ Usage:
     tracker = AccessTracker(neo4j_service)
     await tracker.record_access(memory_ids=["mem_001", "mem_002"])
 
+    # Or buffer accesses and write them in batches (call close() on shutdown)
+    await tracker.buffer_access(memory_ids=["mem_001"])
+    await tracker.close()
+
     # Get metadata for re-ranking
     metadata = await tracker.get_access_metadata(["mem_001"])
 """
 
+import asyncio
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -32,13 +39,31 @@ class AccessTracker:
     - Usage analytics and reporting
     """
 
-    def __init__(self, neo4j_service: Neo4jService):
+    def __init__(
+        self,
+        neo4j_service: Neo4jService,
+        flush_threshold: int = 100,
+        flush_interval_seconds: float = 5.0,
+    ):
         """Initialize access tracker.
 
         Args:
             neo4j_service: Neo4j service for database operations
+            flush_threshold: Buffered memory count that triggers a write
+            flush_interval_seconds: Maximum age of buffered accesses before a write
         """
         self.neo4j = neo4j_service
+        self.flush_threshold = flush_threshold
+        self.flush_interval_seconds = flush_interval_seconds
+
+        # Write-behind buffer: memory_id -> access count (last access time kept separately)
+        self._access_buffer: defaultdict[str, int] = defaultdict(int)
+        self._last_access: dict[str, datetime] = {}
+        self._last_flush = time.monotonic()
+
+        # Timer that flushes the buffer flush_interval_seconds after it stops being empty
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task[int]] = None
 
     async def record_access(
         self,
@@ -79,6 +104,97 @@ class AccessTracker:
             # Don't raise - access tracking is non-critical
             return 0
 
+    async def buffer_access(
+        self,
+        memory_ids: list[str],
+        access_time: Optional[datetime] = None,
+    ) -> int:
+        """Buffer accesses and write them to Neo4j in batches.
+
+        Accesses are aggregated per memory and flushed in a single query once
+        flush_threshold memories are buffered, or at the latest
+        flush_interval_seconds after the first buffered access (a timer
+        flushes them even if no further accesses arrive).
+
+        Args:
+            memory_ids: List of memory IDs that were accessed
+            access_time: When memories were accessed (defaults to now)
+
+        Returns:
+            Number of memories written (0 if the accesses were only buffered)
+        """
+        if not memory_ids:
+            return 0
+
+        access_time = access_time or datetime.now(timezone.utc)
+        for memory_id in memory_ids:
+            self._access_buffer[memory_id] += 1
+            self._last_access[memory_id] = access_time
+
+        if (
+            len(self._access_buffer) >= self.flush_threshold
+            or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        ):
+            return await self.flush()
+
+        if self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.flush_interval_seconds, self._start_timed_flush
+            )
+
+        return 0
+
+    def _start_timed_flush(self) -> None:
+        """Flush the buffer from the interval timer callback."""
+        self._flush_timer = None
+        self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> int:
+        """Write all buffered accesses to Neo4j in one round-trip.
+
+        Returns:
+            Number of memories successfully updated
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        self._last_flush = time.monotonic()
+        if not self._access_buffer:
+            return 0
+
+        # Swap the buffer out before awaiting so new accesses start a fresh batch
+        rows = [
+            {
+                "memory_id": memory_id,
+                "count": count,
+                "last_accessed": self._last_access[memory_id],
+            }
+            for memory_id, count in self._access_buffer.items()
+        ]
+        self._access_buffer = defaultdict(int)
+        self._last_access = {}
+
+        try:
+            updated_count = await self.neo4j.record_memory_access_counts(rows)
+
+            logger.debug(
+                f"Flushed buffered access for {updated_count}/{len(rows)} memories"
+            )
+
+            return updated_count
+
+        except Exception as e:
+            logger.error(f"Failed to flush buffered access: {e}", exc_info=True)
+            # Don't raise - access tracking is non-critical
+            return 0
+
+    async def close(self) -> None:
+        """Stop the flush timer and write any remaining buffered accesses."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self.flush()
+
     async def get_access_metadata(
         self, memory_ids: list[str]
     ) -> dict[str, AccessMetadata]:
@@ -365,14 +365,16 @@ class BudgetManager:
             ) > 10:
                 truncated_content = truncated_content[:-10] + "..."
 
-        # Create new memory with truncated content
-        return ExtractedMemory(
-            memory_id=memory.memory_id,
-            memory_type=memory.memory_type,
-            content=truncated_content,
-            confidence=memory.confidence,
-            source_conversation_id=memory.source_conversation_id,
-            extraction_timestamp=memory.extraction_timestamp,
-            category=memory.category,
-            metadata=memory.metadata,
+        # Create new memory with truncated content (all other fields already validated)
+        return ExtractedMemory.from_trusted(
+            {
+                "memory_id": memory.memory_id,
+                "memory_type": memory.memory_type,
+                "content": truncated_content,
+                "confidence": memory.confidence,
+                "source_conversation_id": memory.source_conversation_id,
+                "extraction_timestamp": memory.extraction_timestamp,
+                "category": memory.category,
+                "metadata": memory.metadata,
+            }
         )
@@ -203,6 +203,8 @@ class Deduplicator:
         """
         duplicate_indices: set[int] = set()
         duplicate_ids: list[str] = []
+        # Checked once so per-pair debug messages aren't formatted when disabled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         n = len(memories)
         for i in range(n):
@@ -219,19 +221,21 @@ class Deduplicator:
                     if memories[i].memory.confidence >= memories[j].memory.confidence:
                         duplicate_indices.add(j)
                         duplicate_ids.append(memories[j].memory.memory_id)
-                        logger.debug(
-                            f"Exact duplicate: Removing {memories[j].memory.memory_id} "
-                            f"(lower confidence {memories[j].memory.confidence:.3f} vs "
-                            f"{memories[i].memory.confidence:.3f})"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Exact duplicate: Removing {memories[j].memory.memory_id} "
+                                f"(lower confidence {memories[j].memory.confidence:.3f} vs "
+                                f"{memories[i].memory.confidence:.3f})"
+                            )
                     else:
                         duplicate_indices.add(i)
                         duplicate_ids.append(memories[i].memory.memory_id)
-                        logger.debug(
-                            f"Exact duplicate: Removing {memories[i].memory.memory_id} "
-                            f"(lower confidence {memories[i].memory.confidence:.3f} vs "
-                            f"{memories[j].memory.confidence:.3f})"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Exact duplicate: Removing {memories[i].memory.memory_id} "
+                                f"(lower confidence {memories[i].memory.confidence:.3f} vs "
+                                f"{memories[j].memory.confidence:.3f})"
+                            )
                         break  # i is removed, move to next i
 
         return duplicate_indices, duplicate_ids
@@ -258,6 +262,7 @@ class Deduplicator:
         """
         similar_indices: set[int] = set()
         similar_ids: list[str] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         n = len(memories)
         for i in range(n):
@@ -274,21 +279,23 @@ class Deduplicator:
                     if memories[i].memory.confidence >= memories[j].memory.confidence:
                         similar_indices.add(j)
                         similar_ids.append(memories[j].memory.memory_id)
-                        logger.debug(
-                            f"Semantic similar: Removing {memories[j].memory.memory_id} "
-                            f"(similarity {similarity_matrix[i, j]:.3f}, "
-                            f"lower confidence {memories[j].memory.confidence:.3f} vs "
-                            f"{memories[i].memory.confidence:.3f})"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Semantic similar: Removing {memories[j].memory.memory_id} "
+                                f"(similarity {similarity_matrix[i, j]:.3f}, "
+                                f"lower confidence {memories[j].memory.confidence:.3f} vs "
+                                f"{memories[i].memory.confidence:.3f})"
+                            )
                     else:
                         similar_indices.add(i)
                         similar_ids.append(memories[i].memory.memory_id)
-                        logger.debug(
-                            f"Semantic similar: Removing {memories[i].memory.memory_id} "
-                            f"(similarity {similarity_matrix[i, j]:.3f}, "
-                            f"lower confidence {memories[i].memory.confidence:.3f} vs "
-                            f"{memories[j].memory.confidence:.3f})"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Semantic similar: Removing {memories[i].memory.memory_id} "
+                                f"(similarity {similarity_matrix[i, j]:.3f}, "
+                                f"lower confidence {memories[i].memory.confidence:.3f} vs "
+                                f"{memories[j].memory.confidence:.3f})"
+                            )
                         break  # i is removed, move to next i
 
         return similar_indices, similar_ids
@@ -5,11 +5,13 @@ This module provides semantic search capabilities using Ollama embeddings
 and Neo4j vector indexes for memory retrieval.
 
 Components:
+- cache.py: Persistent SQLite cache for embedding vectors
 - models.py: Pydantic models for embedding workflow
 - ollama_client.py: Async HTTP client for Ollama embedding API
 - retrieval_service.py: Semantic search and relevance scoring service
 """
 
+from haia.embedding.cache import EmbeddingCache
 from haia.embedding.models import (
     BackfillProgress,
     EmbeddingError,
@@ -31,6 +33,7 @@ except ImportError:
     pass  # DeduplicationResult not yet available, will rebuild later
 
 __all__ = [
+    "EmbeddingCache",
     "EmbeddingRequest",
     "EmbeddingResponse",
     "RetrievalQuery",
@@ -0,0 +1,169 @@
+"""Persistent embedding cache backed by SQLite.
+
+Stores embedding vectors keyed by a hash of (model, text) so repeated texts
+skip the Ollama round-trip even across process restarts. Vectors are stored
+as raw float32 bytes. Entries older than max_age_seconds, and the oldest
+entries beyond max_entries, are evicted when the cache is opened and
+periodically as new entries are written.
+
+Usage:
+    cache = EmbeddingCache("data/embedding_cache.sqlite3")
+    key = EmbeddingCache.make_key("nomic-embed-text", "User prefers Docker")
+    vector = cache.get(key)
+    if vector is None:
+        vector = await ollama.embed("User prefers Docker")
+        cache.put(key, vector, model="nomic-embed-text")
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Evict at most once per this many writes so put() stays a single-row insert
+_PRUNE_EVERY = 256
+
+
+class EmbeddingCache:
+    """SQLite-backed write-through cache for embedding vectors.
+
+    The connection is shared across threads (guarded by a lock) so callers
+    can offload get/put to a worker thread with ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: Optional[int] = 100_000,
+        max_age_seconds: Optional[float] = 30 * 24 * 3600.0,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            max_entries: Keep at most this many of the newest entries (None = unbounded)
+            max_age_seconds: Drop entries written longer ago than this (None = never)
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self._puts_since_prune = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                hash BLOB PRIMARY KEY,
+                vec BLOB NOT NULL,
+                ts INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_ts ON embeddings (ts)")
+        self._conn.commit()
+
+        removed = self.prune()
+        logger.info(f"Initialized EmbeddingCache at {self.path} (evicted {removed} entries)")
+
+    @staticmethod
+    def make_key(model: str, text: str) -> bytes:
+        """Build the cache key for a text embedded with a given model.
+
+        Args:
+            model: Embedding model name/version
+            text: Embedded text
+
+        Returns:
+            32-byte SHA-256 digest of "model:text"
+        """
+        return hashlib.sha256(f"{model}:{text}".encode()).digest()
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Look up a cached embedding.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            float32 embedding vector, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vec FROM embeddings WHERE hash = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def put(self, key: bytes, vector: np.ndarray | list[float], model: str = "") -> None:
+        """Store an embedding, replacing any existing entry for the key.
+
+        Args:
+            key: Key from make_key()
+            vector: Embedding vector
+            model: Embedding model name (kept for inspection/cleanup)
+        """
+        blob = np.asarray(vector, dtype=np.float32).tobytes()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (model, hash, vec, ts) VALUES (?, ?, ?, ?)",
+                (model, key, blob, int(time.time())),
+            )
+            self._conn.commit()
+            self._puts_since_prune += 1
+            due = self._puts_since_prune >= _PRUNE_EVERY
+
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Evict expired entries, then the oldest entries beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            self._puts_since_prune = 0
+            if self.max_age_seconds is not None:
+                cutoff = int(time.time() - self.max_age_seconds)
+                removed += self._conn.execute(
+                    "DELETE FROM embeddings WHERE ts < ?", (cutoff,)
+                ).rowcount
+            if self.max_entries is not None:
+                removed += self._conn.execute(
+                    """
+                    DELETE FROM embeddings WHERE hash IN (
+                        SELECT hash FROM embeddings ORDER BY ts DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                ).rowcount
+            self._conn.commit()
+
+        if removed:
+            logger.debug(f"Evicted {removed} cached embeddings")
+        return removed
+
+    def __len__(self) -> int:
+        """Return the number of cached embeddings."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+        logger.debug("EmbeddingCache closed")
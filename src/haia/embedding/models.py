@@ -10,10 +10,11 @@ This module defines all data structures used for:
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 from haia.extraction.models import ExtractedMemory
 
@@ -475,10 +476,18 @@ class EmbeddingError(BaseModel):
     error_message: str
     memory_id: str | None = None
     retry_count: int = 0
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns, description="When the error occurred (ns since epoch)"
+    )
 
     recoverable: bool = Field(..., description="Whether error is retryable")
 
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When the error occurred (UTC), materialized on access/serialization."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000, tz=UTC)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -5,11 +5,19 @@ HTTP API with retry logic, error handling, and batch support.
 """
 
 import asyncio
+import json
 import logging
+from types import TracebackType
 from typing import Optional
 
 import httpx
 
+# Parse response bytes directly (orjson via the "fast" extra) to skip the str decode pass
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
 from haia.embedding.models import (
     EmbeddingRequest,
     EmbeddingResponse,
@@ -18,6 +26,9 @@ from haia.embedding.models import (
 
 logger = logging.getLogger(__name__)
 
+# Requests are serialized by pydantic-core (model_dump_json) and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaClient:
     """Async HTTP client for Ollama embedding generation.
@@ -27,6 +38,10 @@ class OllamaClient:
     - Automatic retry with exponential backoff
     - Connection pooling and timeout management
     - Error classification and recovery
+
+    Prefer using the client as an async context manager
+    (``async with OllamaClient() as client:``) so the HTTP client is created
+    once up front instead of being lazily initialized on the first request.
     """
 
     def __init__(
@@ -65,6 +80,32 @@ class OllamaClient:
             )
         return self._client
 
+    def _client_or_raise(self) -> httpx.AsyncClient:
+        """Return the initialized HTTP client without awaiting.
+
+        Raises:
+            RuntimeError: If the HTTP client has not been initialized yet
+        """
+        if self._client is None:
+            raise RuntimeError(
+                "Ollama HTTP client not initialized - use 'async with OllamaClient()'"
+            )
+        return self._client
+
+    async def __aenter__(self) -> "OllamaClient":
+        """Eagerly create the HTTP client when entering the context."""
+        await self._get_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the HTTP client when leaving the context."""
+        await self.close()
+
     async def close(self) -> None:
         """Close HTTP client and release connections."""
         if self._client:
@@ -194,31 +235,38 @@ class OllamaClient:
             EmbeddingError: If all retries fail
         """
         max_attempts = max_retries if max_retries is not None else self.default_max_retries
+        # Always make at least one attempt so every exit is a return or a raise
+        max_attempts = max(max_attempts, 1)
         retry_delay = 1.0  # Initial delay in seconds
 
-        last_error: Optional[Exception] = None
+        # Initialize the HTTP client once so attempts don't re-check it
+        if self._client is None:
+            await self._get_client()
+
+        # Pre-bind hot lookups used inside the retry loop
+        execute = self._execute_request
+        sleep = asyncio.sleep
+        warn = logger.warning
 
         for attempt in range(1, max_attempts + 1):
             try:
-                return await self._execute_request(request)
+                return await execute(request)
             except EmbeddingException as e:
-                last_error = e
-
                 # Don't retry non-recoverable errors
                 if not e.recoverable:
                     logger.error(f"Non-recoverable error: {e.error_message}")
                     raise
 
-                if attempt < max_attempts:
-                    logger.warning(
-                        f"Attempt {attempt}/{max_attempts} failed: {e.error_message}. "
-                        f"Retrying in {retry_delay:.1f}s..."
-                    )
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    retry_delay = min(retry_delay, 30.0)  # Cap at 30s
+                if attempt >= max_attempts:
+                    raise
+
+                warn(
+                    f"Attempt {attempt}/{max_attempts} failed: {e.error_message}. "
+                    f"Retrying in {retry_delay:.1f}s..."
+                )
+                await sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30.0)  # Exponential backoff, capped at 30s
             except Exception as e:
-                last_error = e
                 logger.error(f"Unexpected error on attempt {attempt}: {e}")
                 if attempt >= max_attempts:
                     raise EmbeddingException(
@@ -227,22 +275,8 @@ class OllamaClient:
                         recoverable=False,
                     ) from e
 
-        # All retries exhausted
-        if last_error:
-            if isinstance(last_error, EmbeddingException):
-                raise last_error
-            else:
-                raise EmbeddingException(
-                    error_type="unknown",
-                    error_message=str(last_error),
-                    recoverable=False,
-                ) from last_error
-        else:
-            raise EmbeddingException(
-                error_type="unknown",
-                error_message="All retries failed",
-                recoverable=False,
-            )
+        # Unreachable: the final attempt always returns or raises
+        raise AssertionError("retry loop exited without result")
 
     async def _execute_request(
         self,
@@ -259,15 +293,16 @@ class OllamaClient:
         Raises:
             EmbeddingError: If request fails
         """
-        client = await self._get_client()
+        client = self._client_or_raise()
 
         try:
             response = await client.post(
                 "/api/embed",
-                json=request.model_dump(),
+                content=request.model_dump_json(),
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             return EmbeddingResponse(**data)
 
         except httpx.ConnectError as e:
@@ -326,3 +361,28 @@ class OllamaClient:
         except Exception as e:
             logger.warning(f"Ollama health check failed: {e}")
             return False
+
+    async def warmup(self) -> bool:
+        """Load the embedding model into Ollama ahead of the first real request.
+
+        The connection pool is already warm after health_check(), but Ollama
+        loads a model lazily on its first embed call, which can take seconds.
+        Embedding a short probe text moves that cost to startup; the model
+        then stays resident for EmbeddingRequest.keep_alive.
+
+        Returns:
+            True if the model answered, False otherwise (never raises)
+        """
+        try:
+            if self._client is None:
+                await self._get_client()
+            response = await self._execute_request(
+                EmbeddingRequest(model=self.model, input="warmup", truncate=True, dimensions=768)
+            )
+            logger.info(
+                f"Ollama model {self.model} warmed up (latency: {response.latency_ms:.1f}ms)"
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Ollama warmup failed: {e}")
+            return False
@@ -4,17 +4,27 @@ This module provides the core retrieval functionality for memory search,
 including relevance scoring, ranking, and deduplication.
 """
 
+import asyncio
+import heapq
+import json
 import logging
+import math
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
+from neo4j.time import DateTime as Neo4jDateTime
+
 from haia.context.access_tracker import AccessTracker
 from haia.context.budget_manager import BudgetManager
 from haia.context.deduplicator import Deduplicator
-from haia.context.models import DeduplicationResult, TruncationStrategy
+from haia.context.models import AccessMetadata, DeduplicationResult, TruncationStrategy
 from haia.context.ranker import Ranker
+from haia.embedding.cache import EmbeddingCache
 from haia.embedding.models import (
+    EmbeddingException,
     RetrievalQuery,
     RetrievalResponse,
     RetrievalResult,
@@ -26,6 +36,29 @@ from haia.services.neo4j import Neo4jService
 
 logger = logging.getLogger(__name__)
 
+# Fields every Neo4j search row needs to become a RetrievalResult
+_REQUIRED_MEMORY_KEYS = frozenset(
+    {
+        "memory_id",
+        "memory_type",
+        "content",
+        "confidence",
+        "source_conversation_id",
+        "similarity_score",
+    }
+)
+
+# Relevance formula constants, shared by the Python scorers and (through
+# _relevance_params) the Cypher query so the two paths score rows identically
+_NEUTRAL_RECENCY = 0.5  # Recency of a memory without a timestamp
+_DEFAULT_TYPE_WEIGHT = 1.0  # Weight of a memory type missing from type_weights
+
+# Maximum texts per Ollama batch request (OllamaClient.embed_batch limit)
+_OLLAMA_MAX_BATCH = 10
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+_background_tasks: set[asyncio.Task[object]] = set()
+
 
 class RetrievalService:
     """Service for semantic memory retrieval.
@@ -35,6 +68,7 @@ class RetrievalService:
     - Vector similarity search via Neo4j
     - Relevance scoring and ranking
     - Deduplication of near-duplicate results
+    - In-memory LRU cache of query embeddings
     """
 
     def __init__(
@@ -47,6 +81,9 @@ class RetrievalService:
         type_weights: dict[str, float] | None = None,
         recency_decay_days: float = 43.3,
         dedup_similarity_threshold: float = 0.92,
+        query_cache_size: int = 1024,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        embed_batch_window_ms: float = 0.0,
     ):
         """Initialize retrieval service.
 
@@ -59,6 +96,10 @@ class RetrievalService:
             type_weights: Weight multipliers by memory type (δ) - defaults to 1.0 for all
             recency_decay_days: Days for recency to decay to ~0.5 (default 43.3)
             dedup_similarity_threshold: Cosine similarity threshold for deduplication (default 0.92)
+            query_cache_size: Maximum cached query embeddings (0 disables caching)
+            embedding_cache: Optional persistent cache consulted on in-memory misses
+            embed_batch_window_ms: How long to collect concurrent embedding misses
+                before sending them to Ollama as one batch (0 = same event-loop tick)
         """
         self.neo4j = neo4j_service
         self.ollama = ollama_client
@@ -66,8 +107,22 @@ class RetrievalService:
         self.confidence_weight = confidence_weight
         self.recency_weight = recency_weight
         self.recency_decay_days = recency_decay_days
+        self._recency_decay_inv = 1.0 / recency_decay_days
         self.dedup_similarity_threshold = dedup_similarity_threshold
 
+        # Query embedding cache (LRU order: oldest first)
+        self.query_cache_size = query_cache_size
+        # Vectors are stored as compact float32 arrays rather than lists of boxed floats
+        self._query_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.embedding_cache = embedding_cache
+
+        # Concurrent embedding misses are coalesced into one Ollama batch request
+        self.embed_batch_window_ms = embed_batch_window_ms
+        self._pending_embeds: dict[str, asyncio.Future[list[float]]] = {}
+        self._embed_flush_scheduled = False
+
         # Default type weights (1.0 = neutral)
         self.type_weights = type_weights or {
             "preference": 1.2,
@@ -77,6 +132,26 @@ class RetrievalService:
             "correction": 1.3,
         }
 
+        # Integer-indexed type weights for batch scoring; the trailing entry is the
+        # weight for unknown types (index -1)
+        self._type_index = {t: i for i, t in enumerate(self.type_weights)}
+        self._type_weight_arr = np.array(
+            [*self.type_weights.values(), _DEFAULT_TYPE_WEIGHT], dtype=np.float64
+        )
+
+        # Same formula as _calculate_relevance_score, evaluated inside the Neo4j query.
+        # Live searches are scored there; the Python scorers only handle rows that
+        # come back without a relevance_score
+        self._relevance_params = {
+            "similarity_weight": similarity_weight,
+            "confidence_weight": confidence_weight,
+            "recency_weight": recency_weight,
+            "recency_decay_days": recency_decay_days,
+            "type_weights": dict(self.type_weights),
+            "neutral_recency": _NEUTRAL_RECENCY,
+            "default_type_weight": _DEFAULT_TYPE_WEIGHT,
+        }
+
         # Initialize context optimization components (Session 9)
         self.deduplicator = Deduplicator()
         self.ranker = Ranker()  # Uses default weights (40/25/20/15)
@@ -114,29 +189,48 @@ class RetrievalService:
         Raises:
             Exception: If retrieval fails
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Step 1: Generate query embedding (or use precomputed)
+        size_hint: Optional[int] = None
         if query.query_embedding is not None:
             query_vector = query.query_embedding
             embedding_latency_ms = 0.0
             logger.debug("Using precomputed query embedding")
         else:
-            embedding_start = time.time()
-            query_vector = await self.generate_embedding(query.query_text)
-            embedding_latency_ms = (time.time() - embedding_start) * 1000
-            logger.debug(f"Generated query embedding ({embedding_latency_ms:.1f}ms)")
+            # Run the exact-scan candidate count while Ollama computes the embedding
+            warmup_task = None
+            if self.neo4j.exact_search_enabled:
+                warmup_task = asyncio.create_task(
+                    self.neo4j.warmup_search(query.memory_types, query.min_confidence)
+                )
+            embedding_start = time.perf_counter()
+            try:
+                query_vector = await self.generate_embedding(query.query_text)
+            except BaseException:
+                if warmup_task is not None:
+                    warmup_task.cancel()
+                raise
+            embedding_latency_ms = (time.perf_counter() - embedding_start) * 1000
+            if warmup_task is not None:
+                size_hint = await warmup_task
+            logger.debug(
+                f"Generated query embedding ({embedding_latency_ms:.1f}ms, "
+                f"cache hits: {self.cache_hits}, misses: {self.cache_misses})"
+            )
 
         # Step 2: Search similar memories via Neo4j vector index
-        search_start = time.time()
+        search_start = time.perf_counter()
         raw_memories = await self.neo4j.search_similar_memories(
             query_vector=query_vector,
             top_k=query.top_k,
             min_confidence=query.min_confidence,
             min_similarity=query.min_similarity,
             memory_types=query.memory_types,
+            size_hint=size_hint,
+            relevance_weights=self._relevance_params,
         )
-        search_latency_ms = (time.time() - search_start) * 1000
+        search_latency_ms = (time.perf_counter() - search_start) * 1000
 
         memories_searched = len(raw_memories)
         logger.debug(
@@ -144,38 +238,86 @@ class RetrievalService:
         )
 
         # Step 3: Convert to RetrievalResult objects with relevance scoring
-        retrieval_results = []
+        # Drop malformed rows up front so the scoring pass itself can't fail
+        rows: list[dict] = []
+        missing_count = 0
+        bad_score_ids: list[str] = []
         for mem_data in raw_memories:
+            if not _REQUIRED_MEMORY_KEYS.issubset(mem_data.keys()):
+                missing_count += 1
+                continue
+            score = mem_data["similarity_score"]
+            if not isinstance(score, (int, float)) or not 0.0 <= score <= 1.0:
+                bad_score_ids.append(mem_data["memory_id"])
+                continue
+            rows.append(mem_data)
+
+        memories: list[ExtractedMemory] = []
+        similarities: list[float] = []
+        db_scores: list[Optional[float]] = []
+        failed_ids: list[str] = []
+        for mem_data in rows:
             try:
                 memory = self._dict_to_memory(mem_data)
-                similarity_score = mem_data["similarity_score"]
-                relevance_score = self._calculate_relevance_score(
-                    memory=memory,
-                    similarity=similarity_score,
-                )
-                retrieval_results.append(
-                    RetrievalResult(
-                        memory=memory,
-                        similarity_score=similarity_score,
-                        relevance_score=relevance_score,
-                        rank=1,  # Temporary placeholder, will be properly assigned after ranking
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Failed to process memory {mem_data.get('memory_id')}: {e}")
+            except ValueError:  # Pydantic ValidationError subclasses ValueError
+                failed_ids.append(mem_data["memory_id"])
                 continue
+            memories.append(memory)
+            similarities.append(mem_data["similarity_score"])
+            db_scores.append(mem_data.get("relevance_score"))
+
+        dropped = len(raw_memories) - len(memories)
+        if dropped:
+            logger.warning(
+                f"Skipped {dropped} malformed memories "
+                f"({missing_count} missing fields, "
+                f"{len(bad_score_ids)} with a non-numeric or out-of-range "
+                f"similarity score: {bad_score_ids}, "
+                f"{len(failed_ids)} invalid: {failed_ids})"
+            )
+
+        # Prefer relevance computed by Neo4j; otherwise score the whole batch in one
+        # vectorized pass against a single "now"
+        now = datetime.now(timezone.utc)
+        if db_scores and None not in db_scores:
+            relevance_scores = db_scores
+        else:
+            relevance_scores = self._calculate_relevance_scores(
+                memories, similarities, now
+            ).tolist()
+
+        retrieval_results = [
+            RetrievalResult(
+                memory=memory,
+                similarity_score=similarity_score,
+                relevance_score=relevance_score,
+                rank=1,  # Temporary placeholder, will be properly assigned after ranking
+            )
+            for memory, similarity_score, relevance_score in zip(
+                memories, similarities, relevance_scores
+            )
+        ]
+
+        # Prefetch access metadata for every candidate while dedup runs; dedup only
+        # drops results, so the metadata is filtered down afterwards (Session 9)
+        meta_task: asyncio.Task[dict[str, AccessMetadata]] | None = None
+        if enable_rerank and len(retrieval_results) > 0:
+            all_ids = [r.memory.memory_id for r in retrieval_results]
+            meta_task = asyncio.create_task(self.access_tracker.get_access_metadata(all_ids))
+            await asyncio.sleep(0)  # Let the query go out before CPU-bound dedup
 
         # Step 4: Deduplicate using embedding-based similarity (Session 9)
+        # (a single result can't have duplicates)
         dedup_result: DeduplicationResult | None = None
-        if enable_dedup and len(retrieval_results) > 0:
-            dedup_start = time.time()
+        if enable_dedup and len(retrieval_results) > 1:
+            dedup_start = time.perf_counter()
             try:
                 dedup_result = await self.deduplicator.deduplicate(
                     memories=retrieval_results,
                     similarity_threshold=self.dedup_similarity_threshold,
                 )
                 retrieval_results = dedup_result.unique_memories
-                dedup_latency_ms = (time.time() - dedup_start) * 1000
+                dedup_latency_ms = (time.perf_counter() - dedup_start) * 1000
                 logger.debug(
                     f"Deduplication removed {dedup_result.total_removed} memories "
                     f"({dedup_latency_ms:.1f}ms): "
@@ -187,49 +329,54 @@ class RetrievalService:
                 logger.warning(f"Deduplication failed, continuing without: {e}")
                 dedup_result = None
 
-        # Step 5: Fetch access metadata for re-ranking (Session 9)
-        if enable_rerank and len(retrieval_results) > 0:
+        # Steps 5-6 only run when re-ranking will use their output
+        ranked = False
+        if meta_task is not None:
+            # Step 5: Attach prefetched access metadata for re-ranking (Session 9)
             try:
-                memory_ids = [r.memory.memory_id for r in retrieval_results]
-                access_metadata_dict = await self.access_tracker.get_access_metadata(memory_ids)
+                access_metadata_dict = await meta_task
 
                 # Attach access metadata to results
                 for result in retrieval_results:
                     result.access_metadata = access_metadata_dict.get(result.memory.memory_id)
 
-                logger.debug(f"Fetched access metadata for {len(memory_ids)} memories")
+                logger.debug(f"Fetched access metadata for {len(retrieval_results)} memories")
             except Exception as e:
                 logger.warning(f"Failed to fetch access metadata: {e}")
 
-        # Step 6: Re-rank using multi-factor scoring (Session 9)
-        if enable_rerank and len(retrieval_results) > 0:
-            rerank_start = time.time()
+            # Step 6: Re-rank using multi-factor scoring (Session 9)
+            rerank_start = time.perf_counter()
             try:
                 retrieval_results = self.ranker.rerank(retrieval_results)
-                rerank_latency_ms = (time.time() - rerank_start) * 1000
+                ranked = True
+                rerank_latency_ms = (time.perf_counter() - rerank_start) * 1000
                 logger.debug(f"Re-ranked {len(retrieval_results)} memories ({rerank_latency_ms:.1f}ms)")
             except Exception as e:
                 logger.warning(f"Re-ranking failed, using original order: {e}")
-                # Fallback to simple relevance sorting
+
+        if not ranked:
+            # Step 6b: Simple sort by relevance score (re-ranking disabled or failed)
+            if token_budget is None:
+                # Only top_k survive Step 8, so select them in O(N log k)
+                retrieval_results = heapq.nlargest(
+                    query.top_k, retrieval_results, key=lambda r: r.relevance_score
+                )
+            else:
+                # The budget sees the full ranked list, so keep the complete sort
                 retrieval_results.sort(key=lambda r: r.relevance_score, reverse=True)
-                for rank, result in enumerate(retrieval_results, start=1):
-                    result.rank = rank
-        else:
-            # Step 6b: Simple sort by relevance score if re-ranking disabled
-            retrieval_results.sort(key=lambda r: r.relevance_score, reverse=True)
             for rank, result in enumerate(retrieval_results, start=1):
                 result.rank = rank
 
         # Step 7: Apply token budget (Session 9)
         if token_budget is not None and len(retrieval_results) > 0:
-            budget_start = time.time()
+            budget_start = time.perf_counter()
             try:
                 retrieval_results = self.budget_manager.apply_budget(
                     memories=retrieval_results,
                     token_budget=token_budget,
                     strategy=truncation_strategy,
                 )
-                budget_latency_ms = (time.time() - budget_start) * 1000
+                budget_latency_ms = (time.perf_counter() - budget_start) * 1000
                 logger.debug(
                     f"Applied token budget ({token_budget} tokens, {truncation_strategy}): "
                     f"{len(retrieval_results)} memories kept ({budget_latency_ms:.1f}ms)"
@@ -240,12 +387,15 @@ class RetrievalService:
         # Step 8: Limit to top_k
         retrieval_results = retrieval_results[: query.top_k]
 
-        # Step 9: Track memory access (Session 9)
+        # Step 9: Track memory access in the background (Session 9)
+        # Accesses are buffered and written to Neo4j in batches
         if track_access and len(retrieval_results) > 0:
             try:
                 memory_ids = [r.memory.memory_id for r in retrieval_results]
-                await self.access_tracker.record_access(memory_ids)
-                logger.debug(f"Tracked access for {len(memory_ids)} memories")
+                task = asyncio.create_task(self.access_tracker.buffer_access(memory_ids))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+                logger.debug(f"Scheduled access tracking for {len(memory_ids)} memories")
             except Exception as e:
                 logger.warning(f"Failed to track access: {e}")
 
@@ -254,7 +404,7 @@ class RetrievalService:
             if dedup_result is not None:
                 result.was_deduplicated = True
 
-        total_latency_ms = (time.time() - start_time) * 1000
+        total_latency_ms = (time.perf_counter() - start_time) * 1000
 
         # Calculate memories_matched (before dedup)
         memories_matched = memories_searched  # All searched memories matched initially
@@ -287,6 +437,10 @@ class RetrievalService:
     async def generate_embedding(self, text: str) -> list[float]:
         """Generate embedding vector for text.
 
+        Repeated query texts are served from an in-memory LRU cache, then
+        from the persistent embedding cache (if configured), instead of
+        making another round-trip to Ollama.
+
         Args:
             text: Text to embed
 
@@ -296,12 +450,151 @@ class RetrievalService:
         Raises:
             EmbeddingError: If embedding generation fails
         """
-        return await self.ollama.embed(text)
+        if self.query_cache_size <= 0 and self.embedding_cache is None:
+            return await self._embed_coalesced(text)
+        return await self._embed_cached(text)
+
+    async def generate_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts.
+
+        Cached texts are served from the caches; all misses are sent to
+        Ollama together via the batch endpoint.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in the same order as texts
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        return list(await asyncio.gather(*(self.generate_embedding(text) for text in texts)))
+
+    async def _embed_cached(self, text: str) -> list[float]:
+        """Embed text through the in-memory LRU and persistent caches.
+
+        Lookups go LRU -> persistent cache -> Ollama; fresh embeddings are
+        written through to both layers.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector (a fresh list, so callers may mutate it)
+        """
+        model = str(getattr(self.ollama, "model", ""))
+        key = EmbeddingCache.make_key(model, text)
+
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached.tolist()
+
+        vector = None
+        if self.embedding_cache is not None:
+            try:
+                vector = await asyncio.to_thread(self.embedding_cache.get, key)
+            except Exception as e:
+                logger.warning(f"Persistent embedding cache lookup failed: {e}")
+
+        if vector is not None:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            embedding = await self._embed_coalesced(text)
+            # Round to float32 on misses too, so hits and misses return identical vectors
+            vector = np.asarray(embedding, dtype=np.float32)
+
+            if self.embedding_cache is not None:
+                try:
+                    await asyncio.to_thread(self.embedding_cache.put, key, vector, model)
+                except Exception as e:
+                    logger.warning(f"Persistent embedding cache write failed: {e}")
+
+        if self.query_cache_size > 0:
+            self._query_cache[key] = vector
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+        return vector.tolist()
+
+    async def _embed_coalesced(self, text: str) -> list[float]:
+        """Embed text, batching it with other misses in flight at the same time.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        loop = asyncio.get_running_loop()
+        future = self._pending_embeds.get(text)
+        if future is None:
+            future = loop.create_future()
+            self._pending_embeds[text] = future
+
+        if not self._embed_flush_scheduled:
+            self._embed_flush_scheduled = True
+            if self.embed_batch_window_ms > 0:
+                loop.call_later(self.embed_batch_window_ms / 1000, self._start_embed_flush)
+            else:
+                loop.call_soon(self._start_embed_flush)
+
+        # Shield so one cancelled caller doesn't cancel the shared result
+        return list(await asyncio.shield(future))
+
+    def _start_embed_flush(self) -> None:
+        """Send the pending embedding batch from an event-loop callback."""
+        task = asyncio.create_task(self._flush_embed_batch())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def _flush_embed_batch(self) -> None:
+        """Embed all pending texts and resolve their futures."""
+        pending = self._pending_embeds
+        self._pending_embeds = {}
+        self._embed_flush_scheduled = False
+
+        texts = list(pending)
+        try:
+            if len(texts) == 1:
+                embeddings = [await self.ollama.embed(texts[0])]
+            else:
+                embeddings = []
+                for start in range(0, len(texts), _OLLAMA_MAX_BATCH):
+                    embeddings.extend(
+                        await self.ollama.embed_batch(texts[start : start + _OLLAMA_MAX_BATCH])
+                    )
+                logger.debug(f"Coalesced {len(texts)} embedding requests into one batch")
+            if len(embeddings) != len(texts):
+                # zip() would stop early and leave the remaining callers waiting
+                raise EmbeddingException(
+                    f"Expected {len(texts)} embeddings, got {len(embeddings)}",
+                    recoverable=False,
+                )
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled (e.g. at shutdown) - don't leave callers awaiting forever
+            for future in pending.values():
+                future.cancel()
+            raise
+
+        for text, embedding in zip(texts, embeddings):
+            future = pending[text]
+            if not future.done():
+                future.set_result(embedding)
 
     def _calculate_relevance_score(
         self,
         memory: ExtractedMemory,
         similarity: float,
+        now: datetime | None = None,
     ) -> float:
         """Calculate relevance score using multi-factor weighted combination.
 
@@ -318,6 +611,7 @@ class RetrievalService:
         Args:
             memory: Extracted memory with confidence, type, and timestamp
             similarity: Cosine similarity score (0.0-1.0)
+            now: Reference time for recency (defaults to current UTC time)
 
         Returns:
             Relevance score (0.0+, typically 0.0-1.3 with default type weights)
@@ -325,10 +619,10 @@ class RetrievalService:
         confidence = memory.confidence
 
         # Calculate recency score using exponential decay
-        recency_score = self._calculate_recency_score(memory.extraction_timestamp)
+        recency_score = self._calculate_recency_score(memory.extraction_timestamp, now)
 
         # Get type weight multiplier (default to 1.0 if type not found)
-        type_weight = self.type_weights.get(memory.memory_type, 1.0)
+        type_weight = self.type_weights.get(memory.memory_type, _DEFAULT_TYPE_WEIGHT)
 
         # Combine all factors with weights
         base_score = (
@@ -343,21 +637,94 @@ class RetrievalService:
         # Clamp to valid range [0.0, 1.0] to match RetrievalResult constraints
         return max(0.0, min(1.0, final_score))
 
-    def _calculate_recency_score(self, extraction_timestamp: datetime | None) -> float:
+    def _calculate_relevance_scores(
+        self,
+        memories: list[ExtractedMemory],
+        similarities: list[float],
+        now: datetime | None = None,
+    ) -> np.ndarray:
+        """Calculate relevance scores for a batch of memories at once.
+
+        Vectorized equivalent of _calculate_relevance_score() over the batch.
+        Fallback for rows Neo4j returned without a relevance_score (the search
+        query normally computes the same formula from _relevance_params).
+
+        Args:
+            memories: Extracted memories with confidence, type, and timestamp
+            similarities: Cosine similarity score for each memory (0.0-1.0)
+            now: Reference time for recency (defaults to current UTC time)
+
+        Returns:
+            Array of relevance scores clamped to [0.0, 1.0]
+        """
+        n = len(memories)
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+
+        sim = np.asarray(similarities, dtype=np.float64)
+        conf = np.fromiter((m.confidence for m in memories), dtype=np.float64, count=n)
+        type_index = self._type_index
+        type_idx = np.fromiter(
+            (type_index.get(m.memory_type, -1) for m in memories),
+            dtype=np.intp,
+            count=n,
+        )
+        type_weight = np.take(self._type_weight_arr, type_idx)
+
+        # Seconds since epoch (NaN when the memory has no timestamp)
+        ts_epoch = np.fromiter(
+            (
+                np.nan
+                if m.extraction_timestamp is None
+                else (
+                    m.extraction_timestamp.replace(tzinfo=timezone.utc)
+                    if m.extraction_timestamp.tzinfo is None
+                    else m.extraction_timestamp
+                ).timestamp()
+                for m in memories
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+
+        # Work in place on the temporaries: one buffer each for recency and score
+        recency = np.subtract(now_ts, ts_epoch)
+        recency *= -self._recency_decay_inv / 86400.0
+        np.exp(recency, out=recency)
+        np.clip(recency, 0.0, 1.0, out=recency)
+        recency[np.isnan(ts_epoch)] = _NEUTRAL_RECENCY
+
+        score = self.similarity_weight * sim
+        score += self.confidence_weight * conf
+        score += self.recency_weight * recency
+        score *= type_weight
+
+        return np.clip(score, 0.0, 1.0, out=score)
+
+    def _calculate_recency_score(
+        self,
+        extraction_timestamp: datetime | None,
+        now: datetime | None = None,
+    ) -> float:
         """Calculate recency score using exponential decay.
 
         Args:
             extraction_timestamp: When the memory was extracted
+            now: Reference time, captured once per batch by callers scoring many
+                memories (defaults to current UTC time)
 
         Returns:
             Recency score (0.0-1.0), where 1.0 is most recent
         """
         if extraction_timestamp is None:
             # No timestamp available - use neutral score
-            return 0.5
+            return _NEUTRAL_RECENCY
 
         # Calculate days since extraction
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         # Ensure extraction_timestamp is timezone-aware
         if extraction_timestamp.tzinfo is None:
@@ -367,8 +734,10 @@ class RetrievalService:
 
         # Exponential decay: exp(-days / decay_constant)
         # decay_constant = 43.3 gives ~0.5 at 30 days, ~0.1 at 100 days
-        import math
-        recency_score = math.exp(-days_ago / self.recency_decay_days)
+        decay_ratio = days_ago * self._recency_decay_inv
+        if decay_ratio > 30.0:
+            return 0.0  # exp(-30) < 1e-13 - not worth computing
+        recency_score = math.exp(-decay_ratio)
 
         return min(1.0, max(0.0, recency_score))  # Clamp to [0, 1]
 
@@ -410,10 +779,11 @@ class RetrievalService:
         # For production, could use embeddings for more accurate comparison
         deduplicated = []
         removed_count = 0
+        # Checked once so per-collision debug messages aren't formatted when disabled
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for mem, sim, rel in memories:
             is_duplicate = False
-            duplicate_index = -1
 
             for idx, (existing_mem, existing_sim, existing_rel) in enumerate(deduplicated):
                 # Check if content is very similar
@@ -421,20 +791,23 @@ class RetrievalService:
                     mem.content, existing_mem.content, similarity_threshold
                 ):
                     is_duplicate = True
-                    duplicate_index = idx
                     # If new memory has higher confidence, replace existing
                     if mem.confidence > existing_mem.confidence:
                         deduplicated[idx] = (mem, sim, rel)
-                        logger.debug(
-                            f"Replaced duplicate {existing_mem.memory_id} with {mem.memory_id} "
-                            f"(higher confidence: {mem.confidence:.3f} > {existing_mem.confidence:.3f})"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Replaced duplicate {existing_mem.memory_id} with "
+                                f"{mem.memory_id} (higher confidence: {mem.confidence:.3f} > "
+                                f"{existing_mem.confidence:.3f})"
+                            )
                     else:
                         removed_count += 1
-                        logger.debug(
-                            f"Removed duplicate {mem.memory_id} "
-                            f"(lower confidence: {mem.confidence:.3f} <= {existing_mem.confidence:.3f})"
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                f"Removed duplicate {mem.memory_id} "
+                                f"(lower confidence: {mem.confidence:.3f} <= "
+                                f"{existing_mem.confidence:.3f})"
+                            )
                     break
 
             if not is_duplicate:
@@ -480,7 +853,8 @@ class RetrievalService:
 
         return similarity >= threshold
 
-    def _dict_to_memory(self, data: dict) -> ExtractedMemory:
+    @staticmethod
+    def _dict_to_memory(data: dict) -> ExtractedMemory:
         """Convert Neo4j result dictionary to ExtractedMemory.
 
         Args:
@@ -489,13 +863,14 @@ class RetrievalService:
         Returns:
             ExtractedMemory instance
         """
-        # Convert Neo4j DateTime to Python datetime
+        # Search results carry epoch-millisecond ints, which pydantic parses into
+        # UTC datetimes; Neo4j DateTime values are still converted for other queries
         extraction_ts = data.get("extraction_timestamp")
-        if hasattr(extraction_ts, "to_native"):
+        if isinstance(extraction_ts, Neo4jDateTime):
             extraction_ts = extraction_ts.to_native()
 
         embedding_updated = data.get("embedding_updated_at")
-        if hasattr(embedding_updated, "to_native"):
+        if isinstance(embedding_updated, Neo4jDateTime):
             embedding_updated = embedding_updated.to_native()
 
         # Handle metadata - ensure it's always a dict
@@ -504,7 +879,6 @@ class RetrievalService:
             metadata = {}
         elif isinstance(metadata, str):
             # Parse JSON-encoded metadata from Neo4j
-            import json
             try:
                 metadata = json.loads(metadata)
             except json.JSONDecodeError:
@@ -526,6 +900,14 @@ class RetrievalService:
             embedding_updated_at=embedding_updated,
         )
 
+    async def close(self) -> None:
+        """Flush buffered access tracking and close the persistent embedding cache."""
+        if _background_tasks:
+            await asyncio.gather(*_background_tasks, return_exceptions=True)
+        await self.access_tracker.close()
+        if self.embedding_cache is not None:
+            await asyncio.to_thread(self.embedding_cache.close)
+
     async def health_check(self) -> bool:
         """Check if retrieval service is operational.
 
@@ -4,22 +4,44 @@ This package provides automatic memory extraction from conversation transcripts
 using PydanticAI with confidence scoring and structured output.
 """
 
-from haia.extraction.extractor import ExtractionService
+from typing import TYPE_CHECKING, Any
+
 from haia.extraction.models import (
     ConversationTranscript,
     ExtractedMemory,
+    ExtractionBatchResult,
     ExtractionResult,
     Message,
     MemoryCategory,
+    MemoryType,
     ConfidenceLevel,
 )
 
+if TYPE_CHECKING:
+    from haia.extraction.extractor import ExtractionService
+
 __all__ = [
     "ExtractionService",
     "ConversationTranscript",
     "ExtractedMemory",
+    "ExtractionBatchResult",
     "ExtractionResult",
     "Message",
     "MemoryCategory",
+    "MemoryType",
     "ConfidenceLevel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ExtractionService on first access.
+
+    The extractor pulls in PydanticAI (over a second of import time), which
+    modules that only need the extraction models should not pay for.
+    """
+    if name == "ExtractionService":
+        from haia.extraction.extractor import ExtractionService
+
+        globals()[name] = ExtractionService
+        return ExtractionService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
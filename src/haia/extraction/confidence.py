@@ -5,8 +5,29 @@ LLM-assigned base confidence with deterministic signals like explicitness,
 mention frequency, and contradictions.
 """
 
+import re
 from typing import Any
 
+# Correction indicators matched as lowercase substrings of a message
+CORRECTION_INDICATORS = (
+    "actually",
+    "i meant",
+    "correction",
+    "sorry",
+    "i misspoke",
+    "not ",
+    "no wait",
+    "let me correct",
+    "to be clear",
+)
+
+# All indicators compiled into one alternation so a message is scanned in a
+# single pass by the regex engine instead of once per indicator
+_CORRECTION_PATTERN = re.compile("|".join(map(re.escape, CORRECTION_INDICATORS)))
+
+# Common words ignored as key terms by detect_multi_mentions
+_MENTION_STOPWORDS = frozenset({"about", "using", "prefer", "prefers", "cluster", "server"})
+
 
 class ConfidenceCalculator:
     """Calculator for memory extraction confidence scores."""
@@ -143,22 +164,24 @@ def detect_multi_mentions(
     """
     # Extract key terms from content (simple approach: split and filter)
     # In production, this could use NLP techniques, but keeping it simple for MVP
-    key_terms = [
+    key_terms = {
         word.lower()
         for word in content.split()
         if len(word) > 4  # Filter short words
-        and word.lower()
-        not in {"about", "using", "prefer", "prefers", "cluster", "server"}
-    ]
+        and word.lower() not in _MENTION_STOPWORDS
+    }
 
     if not key_terms:
         return 1  # No meaningful terms found
 
+    # Compile the key terms once and scan each message in a single pass
+    key_term_pattern = re.compile("|".join(map(re.escape, sorted(key_terms))))
+
     mention_count = 0
     for msg in conversation_messages:
         msg_content = msg.get("content", "").lower()
         # Check if any key terms appear in message
-        if any(term in msg_content for term in key_terms):
+        if key_term_pattern.search(msg_content):
             mention_count += 1
 
     return max(1, mention_count)  # Minimum 1
@@ -204,17 +227,4 @@ def detect_correction_patterns(text: str) -> bool:
         >>> detect_correction_patterns("I prefer Docker")
         False
     """
-    correction_indicators = [
-        "actually",
-        "i meant",
-        "correction",
-        "sorry",
-        "i misspoke",
-        "not ",
-        "no wait",
-        "let me correct",
-        "to be clear",
-    ]
-
-    text_lower = text.lower()
-    return any(indicator in text_lower for indicator in correction_indicators)
+    return _CORRECTION_PATTERN.search(text.lower()) is not None
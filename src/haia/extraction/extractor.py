@@ -4,16 +4,23 @@ This module implements the core extraction logic using a PydanticAI agent
 configured with structured output for reliable memory extraction.
 """
 
+import asyncio
+import hashlib
 import logging
 import time
+from collections import OrderedDict
 from typing import Any
 
 from pydantic import ValidationError
 from pydantic_ai import Agent
 from pydantic_ai.models import KnownModelName
 
-from haia.extraction.models import ConversationTranscript, ExtractionResult
-from haia.extraction.prompts import format_transcript, system_prompt
+from haia.extraction.models import (
+    ConversationTranscript,
+    ExtractionBatchResult,
+    ExtractionResult,
+)
+from haia.extraction.prompts import format_transcript, format_transcript_batch, system_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +32,9 @@ class ExtractionService:
         self,
         model: KnownModelName | str = "anthropic:claude-haiku-4-5-20251001",
         min_confidence: float = 0.4,
+        result_cache_size: int = 256,
+        result_cache_ttl: float = 3600.0,
+        batch_size: int = 1,
     ):
         """Initialize extraction service with PydanticAI agent.
 
@@ -32,10 +42,24 @@ class ExtractionService:
             model: LLM model to use (e.g., 'anthropic:claude-haiku-4-5-20251001',
                    'ollama:qwen2.5-coder', 'ollama:llama3.1')
             min_confidence: Minimum confidence threshold for memories (default: 0.4)
+            result_cache_size: Max LLM outputs kept for identical transcripts
+                (default: 256, 0 disables caching)
+            result_cache_ttl: Seconds a cached LLM output stays valid (default: 3600)
+            batch_size: Transcripts sent per LLM call by extract_batch()
+                (default: 1, i.e. one call per transcript; raise to opt in to batching)
         """
         self.model = model
         self.min_confidence = min_confidence
 
+        # LLM outputs keyed by sha256(model | prompt): retries and replays of the
+        # same transcript skip the LLM round-trip
+        self.result_cache_size = result_cache_size
+        self.result_cache_ttl = result_cache_ttl
+        self._result_cache: OrderedDict[bytes, tuple[float, ExtractionResult]] = OrderedDict()
+        # One shared agent task per prompt in flight, and how many callers await each
+        self._inflight: dict[bytes, asyncio.Task[ExtractionResult]] = {}
+        self._inflight_waiters: dict[asyncio.Task[ExtractionResult], int] = {}
+
         # Configure PydanticAI Agent with structured output
         self.agent: Agent[None, ExtractionResult] = Agent(
             model=model,
@@ -43,6 +67,14 @@ class ExtractionService:
             system_prompt=system_prompt(),
         )
 
+        # Same instructions, structured output for several transcripts per call
+        self.batch_size = batch_size
+        self.batch_agent: Agent[None, ExtractionBatchResult] = Agent(
+            model=model,
+            output_type=ExtractionBatchResult,
+            system_prompt=system_prompt(),
+        )
+
         logger.info(
             f"ExtractionService initialized with model={model}, "
             f"min_confidence={min_confidence}"
@@ -62,7 +94,7 @@ class ExtractionService:
         Note:
             Returns partial results on validation errors. Logs all extraction events.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         conversation_id = transcript.conversation_id
 
         logger.info(
@@ -74,41 +106,15 @@ class ExtractionService:
             # Format transcript for LLM
             user_prompt = format_transcript(transcript)
 
-            # Run PydanticAI agent
-            result = await self.agent.run(user_prompt)
+            # Run PydanticAI agent (or reuse its output for an identical prompt)
+            extraction_result = await self._run_agent(user_prompt)
 
-            # Extract data from agent result
-            extraction_result = result.output
-
-            # Validate and filter memories by confidence threshold
-            validated_memories = [
-                memory
-                for memory in extraction_result.memories
-                if memory.confidence >= self.min_confidence
-            ]
-
-            # Calculate extraction duration
-            duration = time.time() - start_time
-
-            # Create final result
-            final_result = ExtractionResult(
-                conversation_id=conversation_id,
-                memories=validated_memories,
-                extraction_duration=duration,
-                model_used=self.model,
+            return self._build_result(
+                conversation_id, extraction_result, time.perf_counter() - start_time
             )
 
-            logger.info(
-                f"Extraction complete for conversation_id={conversation_id}, "
-                f"duration={duration:.2f}s, "
-                f"memory_count={len(validated_memories)}, "
-                f"filtered_count={len(extraction_result.memories) - len(validated_memories)}"
-            )
-
-            return final_result
-
         except ValidationError as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(
                 f"Validation error for conversation_id={conversation_id}: {e}",
                 exc_info=True,
@@ -122,7 +128,7 @@ class ExtractionService:
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(
                 f"Extraction failed for conversation_id={conversation_id}: {e}",
                 exc_info=True,
@@ -135,14 +141,230 @@ class ExtractionService:
                 error=str(e),
             )
 
+    def _build_result(
+        self, conversation_id: str, extraction_result: ExtractionResult, duration: float
+    ) -> ExtractionResult:
+        """Build the final result from the agent output for one conversation.
+
+        Args:
+            conversation_id: Conversation the output belongs to
+            extraction_result: Raw ExtractionResult produced by the agent
+            duration: Extraction time in seconds
+
+        Returns:
+            ExtractionResult with memories below min_confidence filtered out
+        """
+        # Validate and filter memories by confidence threshold
+        validated_memories = [
+            memory
+            for memory in extraction_result.memories
+            if memory.confidence >= self.min_confidence
+        ]
+
+        # Create final result (memories were validated by the agent's output type)
+        final_result = ExtractionResult.from_trusted(
+            {
+                "conversation_id": conversation_id,
+                "memories": validated_memories,
+                "extraction_duration": duration,
+                "model_used": self.model,
+            }
+        )
+
+        logger.info(
+            f"Extraction complete for conversation_id={conversation_id}, "
+            f"duration={duration:.2f}s, "
+            f"memory_count={len(validated_memories)}, "
+            f"filtered_count={len(extraction_result.memories) - len(validated_memories)}"
+        )
+
+        return final_result
+
+    def _cache_key(self, user_prompt: str) -> bytes:
+        """Build the result cache key for a prompt.
+
+        Args:
+            user_prompt: Formatted transcript prompt
+
+        Returns:
+            SHA-256 digest of "model|prompt"
+        """
+        return hashlib.sha256(f"{self.model}|{user_prompt}".encode()).digest()
+
+    def _cache_store(self, key: bytes, output: ExtractionResult) -> None:
+        """Store an agent output, evicting the least recently used entry.
+
+        Args:
+            key: Key from _cache_key()
+            output: Raw ExtractionResult produced by the agent
+        """
+        self._result_cache[key] = (time.monotonic(), output)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    async def _run_agent(self, user_prompt: str) -> ExtractionResult:
+        """Run the agent on a prompt, reusing cached or in-flight outputs.
+
+        Concurrent calls with the same prompt share a single LLM request.
+        A cancelled caller only cancels that request once no other caller
+        is waiting for it. Failures are not cached.
+
+        Args:
+            user_prompt: Formatted transcript prompt
+
+        Returns:
+            Raw ExtractionResult produced by the agent
+        """
+        if self.result_cache_size <= 0:
+            result = await self.agent.run(user_prompt)
+            return result.output
+
+        key = self._cache_key(user_prompt)
+
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            stored_at, output = cached
+            if time.monotonic() - stored_at < self.result_cache_ttl:
+                self._result_cache.move_to_end(key)
+                logger.debug("Extraction cache hit - skipping LLM call")
+                # Callers get their own copy so cached memories are never shared
+                return output.model_copy(deep=True)
+            del self._result_cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_shared(key, user_prompt))
+            self._inflight[key] = task
+        else:
+            logger.debug("Joining in-flight extraction for identical transcript")
+
+        waiters = self._inflight_waiters
+        waiters[task] = waiters.get(task, 0) + 1
+        try:
+            # Shield so one cancelled caller doesn't cancel the request for the others
+            output = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if waiters[task] == 1:
+                task.cancel()  # Last caller gone - nobody needs the result
+            raise
+        finally:
+            waiters[task] -= 1
+            if not waiters[task]:
+                del waiters[task]
+
+        return output.model_copy(deep=True)
+
+    async def _run_shared(self, key: bytes, user_prompt: str) -> ExtractionResult:
+        """Run the agent once for a prompt shared by concurrent callers.
+
+        Args:
+            key: Key from _cache_key()
+            user_prompt: Formatted transcript prompt
+
+        Returns:
+            Raw ExtractionResult produced by the agent (also cached)
+        """
+        try:
+            result = await self.agent.run(user_prompt)
+        finally:
+            del self._inflight[key]
+
+        self._cache_store(key, result.output)
+        return result.output
+
+    async def _extract_group(
+        self, transcripts: list[ConversationTranscript], semaphore: asyncio.Semaphore
+    ) -> list[ExtractionResult]:
+        """Extract memories from several transcripts with a single LLM call.
+
+        Args:
+            transcripts: Transcripts to send in one prompt
+            semaphore: Limits concurrent LLM calls across the whole batch
+
+        Returns:
+            List of ExtractionResult objects in same order as input
+
+        Note:
+            Transcripts missing from the batched output, those whose output
+            holds memories from another conversation, or the whole group if the
+            batched call fails, fall back to concurrent extract_memories()
+            calls. Each call, batched or fallback, holds its own semaphore slot.
+        """
+        start_time = time.perf_counter()
+        async with semaphore:
+            try:
+                result = await self.batch_agent.run(format_transcript_batch(transcripts))
+                batch_output = result.output.results
+            except Exception as e:
+                logger.warning(
+                    f"Batched extraction of {len(transcripts)} transcripts failed, "
+                    f"extracting individually: {e}"
+                )
+                batch_output = []
+        duration = time.perf_counter() - start_time
+
+        # Results are matched by the ids the LLM echoed back, so only trust a
+        # result whose memories all point at that same conversation
+        batch_ids = {t.conversation_id for t in transcripts}
+        outputs: dict[str, ExtractionResult] = {}
+        for output in batch_output:
+            if output.conversation_id not in batch_ids:
+                logger.warning(
+                    f"Ignoring batched result for unknown conversation "
+                    f"{output.conversation_id}"
+                )
+                continue
+            mismatched = [
+                m for m in output.memories
+                if m.source_conversation_id != output.conversation_id
+            ]
+            if mismatched:
+                logger.warning(
+                    f"Batched result for {output.conversation_id} has "
+                    f"{len(mismatched)} memories from other conversations, "
+                    f"extracting it individually"
+                )
+                continue
+            outputs[output.conversation_id] = output
+
+        async def extract_with_semaphore(
+            transcript: ConversationTranscript,
+        ) -> ExtractionResult:
+            async with semaphore:
+                return await self.extract_memories(transcript)
+
+        # Fallbacks are independent LLM calls: run them concurrently rather
+        # than paying one round-trip per missing transcript in sequence
+        missing = [t for t in transcripts if t.conversation_id not in outputs]
+        fallback_results = iter(
+            await asyncio.gather(*[extract_with_semaphore(t) for t in missing])
+        )
+
+        results = []
+        for transcript in transcripts:
+            output = outputs.get(transcript.conversation_id)
+            if output is None:
+                results.append(next(fallback_results))
+                continue
+            if self.result_cache_size > 0:
+                # Later single extractions of this transcript reuse the output
+                self._cache_store(self._cache_key(format_transcript(transcript)), output)
+            results.append(self._build_result(transcript.conversation_id, output, duration))
+
+        return results
+
     async def extract_batch(
         self, transcripts: list[ConversationTranscript], max_concurrency: int = 5
     ) -> list[ExtractionResult]:
         """Extract memories from multiple transcripts in parallel.
 
+        Transcripts are grouped batch_size at a time so each LLM call (and its
+        system prompt) covers several conversations.
+
         Args:
             transcripts: List of conversation transcripts
-            max_concurrency: Maximum number of concurrent extractions (default: 5)
+            max_concurrency: Maximum number of concurrent LLM calls (default: 5)
 
         Returns:
             List of ExtractionResult objects in same order as input
@@ -150,25 +372,30 @@ class ExtractionService:
         Note:
             Uses asyncio semaphore to limit concurrency and avoid overwhelming LLM API.
         """
-        import asyncio
-
         logger.info(
             f"Starting batch extraction for {len(transcripts)} transcripts, "
-            f"max_concurrency={max_concurrency}"
+            f"max_concurrency={max_concurrency}, batch_size={self.batch_size}"
         )
 
         semaphore = asyncio.Semaphore(max_concurrency)
+        batch_size = max(self.batch_size, 1)
+        groups = [
+            transcripts[i : i + batch_size] for i in range(0, len(transcripts), batch_size)
+        ]
 
         async def extract_with_semaphore(
-            transcript: ConversationTranscript,
-        ) -> ExtractionResult:
+            group: list[ConversationTranscript],
+        ) -> list[ExtractionResult]:
+            if len(group) > 1:
+                return await self._extract_group(group, semaphore)
             async with semaphore:
-                return await self.extract_memories(transcript)
+                return [await self.extract_memories(group[0])]
 
-        results = await asyncio.gather(
-            *[extract_with_semaphore(t) for t in transcripts],
+        grouped_results = await asyncio.gather(
+            *[extract_with_semaphore(group) for group in groups],
             return_exceptions=False,
         )
+        results = [result for group_results in grouped_results for result in group_results]
 
         successful = sum(1 for r in results if r.is_successful)
         total_memories = sum(r.memory_count for r in results)
@@ -9,7 +9,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, field_validator
+
+# Memory type values accepted by ExtractedMemory.memory_type (same set as MemoryCategory)
+MemoryType = Literal[
+    "preference", "personal_fact", "technical_context", "decision", "correction"
+]
 
 
 class MemoryCategory(str, Enum):
@@ -43,6 +48,8 @@ class ConfidenceLevel(str, Enum):
 class Message(BaseModel):
     """Single message within a conversation."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str = Field(..., description="Message text content")
     timestamp: datetime = Field(..., description="When message was sent")
     speaker: Literal["user", "assistant"] = Field(
@@ -53,13 +60,20 @@ class Message(BaseModel):
 class ConversationTranscript(BaseModel):
     """Complete conversation transcript for memory extraction."""
 
+    model_config = ConfigDict(frozen=True)
+
     conversation_id: str = Field(..., description="Unique conversation identifier")
     messages: list[Message] = Field(
         ..., min_length=1, description="All messages in chronological order"
     )
     start_time: datetime = Field(..., description="Conversation start timestamp")
     end_time: datetime = Field(..., description="Conversation end timestamp")
-    message_count: int = Field(..., ge=1, description="Total number of messages")
+
+    @computed_field
+    @property
+    def message_count(self) -> int:
+        """Total number of messages (always len(messages), so it can't disagree)."""
+        return len(self.messages)
 
     @property
     def duration_seconds(self) -> float:
@@ -70,13 +84,13 @@ class ConversationTranscript(BaseModel):
 class ExtractedMemory(BaseModel):
     """A single memory extracted from conversation transcript."""
 
+    model_config = ConfigDict(frozen=True)
+
     memory_id: str = Field(
         default_factory=lambda: str(uuid.uuid4()),
         description="Unique memory identifier",
     )
-    memory_type: Literal[
-        "preference", "personal_fact", "technical_context", "decision", "correction"
-    ] = Field(..., description="Primary category of memory")
+    memory_type: MemoryType = Field(..., description="Primary category of memory")
     content: str = Field(
         ..., min_length=1, description="Natural language description of the memory"
     )
@@ -119,6 +133,22 @@ class ExtractedMemory(BaseModel):
         default=0, ge=0, description="Total number of times accessed"
     )
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "ExtractedMemory":
+        """Build a memory from already-validated values without re-validating.
+
+        Only for values derived from another ExtractedMemory (copies, truncated
+        content). Data from the LLM, the API, or Neo4j rows must go through the
+        normal constructor so field validators still apply.
+
+        Args:
+            data: Field values taken from validated memories
+
+        Returns:
+            ExtractedMemory built with model_construct()
+        """
+        return cls.model_construct(**data)
+
     @field_validator("confidence")
     @classmethod
     def validate_confidence_threshold(cls, v: float) -> float:
@@ -143,6 +173,8 @@ class ExtractedMemory(BaseModel):
 class ExtractionResult(BaseModel):
     """Complete extraction result for a conversation."""
 
+    model_config = ConfigDict(frozen=True)
+
     conversation_id: str = Field(..., description="ID of conversation processed")
     memories: list[ExtractedMemory] = Field(
         default_factory=list, description="Extracted memories"
@@ -161,38 +193,85 @@ class ExtractionResult(BaseModel):
         None, description="Error message if extraction failed"
     )
 
+    # (types distribution, average confidence, high-confidence count), stored
+    # with the memories it was computed from. model_copy(update=...) and in-place
+    # edits of the memories list both change that snapshot, so a stale summary
+    # is never returned.
+    _summary: tuple[dict[str, int], float, int] | None = PrivateAttr(default=None)
+    _summary_of: tuple[ExtractedMemory, ...] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "ExtractionResult":
+        """Build a result from already-validated values without re-validating.
+
+        Only for results assembled from validated ExtractedMemory objects (e.g.
+        the agent's structured output after filtering). See
+        ExtractedMemory.from_trusted().
+
+        Args:
+            data: Field values taken from validated models
+
+        Returns:
+            ExtractionResult built with model_construct()
+        """
+        return cls.model_construct(**data)
+
     @computed_field
     @property
     def memory_count(self) -> int:
         """Total number of memories extracted."""
         return len(self.memories)
 
+    def _memory_summary(self) -> tuple[dict[str, int], float, int]:
+        """Compute the memory statistics in one pass (cached until memories change).
+
+        Returns:
+            Tuple of (types distribution, average confidence, high-confidence count)
+        """
+        memories = tuple(self.memories)
+        if self._summary is None or self._summary_of != memories:
+            distribution: dict[str, int] = {}
+            total_confidence = 0.0
+            high_count = 0
+            for memory in self.memories:
+                distribution[memory.memory_type] = (
+                    distribution.get(memory.memory_type, 0) + 1
+                )
+                total_confidence += memory.confidence
+                if memory.is_high_confidence:
+                    high_count += 1
+            average = total_confidence / len(self.memories) if self.memories else 0.0
+            self._summary = (distribution, average, high_count)
+            self._summary_of = memories
+        return self._summary
+
     @computed_field
     @property
     def memory_types_distribution(self) -> dict[str, int]:
         """Count of memories by type."""
-        distribution: dict[str, int] = {}
-        for memory in self.memories:
-            distribution[memory.memory_type] = (
-                distribution.get(memory.memory_type, 0) + 1
-            )
-        return distribution
+        return dict(self._memory_summary()[0])
 
     @computed_field
     @property
     def average_confidence(self) -> float:
         """Average confidence across all memories."""
-        if not self.memories:
-            return 0.0
-        return sum(m.confidence for m in self.memories) / len(self.memories)
+        return self._memory_summary()[1]
 
     @computed_field
     @property
     def high_confidence_count(self) -> int:
         """Number of high-confidence memories (e0.7)."""
-        return sum(1 for m in self.memories if m.is_high_confidence)
+        return self._memory_summary()[2]
 
     @property
     def is_successful(self) -> bool:
         """Check if extraction succeeded."""
         return self.error is None
+
+
+class ExtractionBatchResult(BaseModel):
+    """Extraction results for several conversations processed in one LLM call."""
+
+    results: list[ExtractionResult] = Field(
+        default_factory=list, description="One extraction result per conversation"
+    )
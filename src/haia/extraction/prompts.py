@@ -114,17 +114,14 @@ Output:
 Remember: Quality over quantity. Extract only meaningful, user-specific information."""
 
 
-def format_transcript(transcript: ConversationTranscript) -> str:
-    """Format conversation transcript for LLM extraction prompt.
+def _transcript_lines(transcript: ConversationTranscript) -> list[str]:
+    """Format the header and messages of a transcript (no instructions).
 
     Args:
         transcript: Conversation transcript to format
 
     Returns:
-        Formatted string ready for LLM processing
-
-    Note:
-        Sends only essential fields to minimize token usage.
+        Prompt lines for the transcript
     """
     lines = [
         f"# Conversation Transcript: {transcript.conversation_id}",
@@ -135,9 +132,28 @@ def format_transcript(transcript: ConversationTranscript) -> str:
         "",
     ]
 
-    for i, msg in enumerate(transcript.messages, 1):
-        timestamp = msg.timestamp.strftime("%H:%M:%S")
-        lines.append(f"[{i}] {timestamp} - {msg.speaker}: {msg.content}")
+    # time().isoformat("seconds") gives the same HH:MM:SS as strftime, ~3x faster
+    lines.extend(
+        f"[{i}] {msg.timestamp.time().isoformat('seconds')} - {msg.speaker}: {msg.content}"
+        for i, msg in enumerate(transcript.messages, 1)
+    )
+
+    return lines
+
+
+def format_transcript(transcript: ConversationTranscript) -> str:
+    """Format conversation transcript for LLM extraction prompt.
+
+    Args:
+        transcript: Conversation transcript to format
+
+    Returns:
+        Formatted string ready for LLM processing
+
+    Note:
+        Sends only essential fields to minimize token usage.
+    """
+    lines = _transcript_lines(transcript)
 
     lines.extend(
         [
@@ -150,3 +166,32 @@ def format_transcript(transcript: ConversationTranscript) -> str:
     )
 
     return "\n".join(lines)
+
+
+def format_transcript_batch(transcripts: list[ConversationTranscript]) -> str:
+    """Format several transcripts into a single extraction prompt.
+
+    Args:
+        transcripts: Conversation transcripts to format
+
+    Returns:
+        Formatted string asking for one ExtractionResult per conversation
+    """
+    lines: list[str] = []
+    for transcript in transcripts:
+        lines.extend(_transcript_lines(transcript))
+        lines.extend(["", "==========", ""])
+
+    conversation_ids = ", ".join(t.conversation_id for t in transcripts)
+    lines.extend(
+        [
+            f"Analyze each of these {len(transcripts)} conversations independently "
+            "and extract all meaningful user memories.",
+            "Return an ExtractionBatchResult with one ExtractionResult per conversation, "
+            f"using its conversation_id ({conversation_ids}) for conversation_id and "
+            "source_conversation_id.",
+            "Only include memories that have confidence e0.4.",
+        ]
+    )
+
+    return "\n".join(lines)
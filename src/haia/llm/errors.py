@@ -11,9 +11,16 @@ correlation_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar(
 
 
 def _get_correlation_id() -> str:
-    """Get current correlation ID or generate new one."""
+    """Get current correlation ID, generating one for this context if unset.
+
+    The generated ID is stored back into the context so later errors in the
+    same request/task share it.
+    """
     corr_id = correlation_id_var.get()
-    return corr_id if corr_id is not None else str(uuid.uuid4())
+    if corr_id is None:
+        corr_id = str(uuid.uuid4())
+        correlation_id_var.set(corr_id)
+    return corr_id
 
 
 class LLMError(Exception):
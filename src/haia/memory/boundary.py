@@ -13,9 +13,19 @@ from haia.memory.models import (
 logger = logging.getLogger(__name__)
 
 
+# Characters of the first message fed to the fingerprint hash
+_HASH_PREFIX_CHARS = 4096
+
+
 # T013: compute_first_message_hash function
 def compute_first_message_hash(messages: list[dict[str, str]]) -> str:
-    """Compute SHA-256 hash of the first message content.
+    """Compute a SHA-256 fingerprint of the first message content.
+
+    The hash only detects a changed first message between requests, so it
+    covers the content length plus the first 4096 characters rather than the
+    whole (possibly very long) message. This keeps the per-request cost
+    constant; it is a change-detection fingerprint, not a cryptographic
+    commitment to the full content.
 
     Args:
         messages: List of OpenAI-format messages
@@ -30,7 +40,9 @@ def compute_first_message_hash(messages: list[dict[str, str]]) -> str:
         raise IndexError("Cannot compute hash of empty message list")
 
     first_message_content = messages[0].get("content", "")
-    return hashlib.sha256(first_message_content.encode("utf-8")).hexdigest()
+    hasher = hashlib.sha256(len(first_message_content).to_bytes(8, "little"))
+    hasher.update(first_message_content[:_HASH_PREFIX_CHARS].encode("utf-8"))
+    return hasher.hexdigest()
 
 
 # T020: detect_boundary function (will be implemented in Phase 3)
@@ -1,11 +1,11 @@
 """Filesystem storage for conversation transcripts."""
 
-import json
+import asyncio
+import heapq
 import logging
+import os
 from pathlib import Path
 
-import aiofiles
-
 from haia.memory.models import ConversationTranscript
 
 logger = logging.getLogger(__name__)
@@ -14,13 +14,17 @@ logger = logging.getLogger(__name__)
 class TranscriptStorage:
     """Manages filesystem storage of conversation transcripts."""
 
-    def __init__(self, storage_dir: str):
+    def __init__(self, storage_dir: str, indent: int | None = None):
         """Initialize transcript storage.
 
         Args:
             storage_dir: Directory path for storing transcripts
+            indent: JSON indentation for stored files (default: None, compact).
+                Transcripts are read back by the extraction pipeline, so
+                pretty-printing is only worth it when inspecting files by hand.
         """
         self.storage_dir = Path(storage_dir)
+        self.indent = indent
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(
@@ -47,12 +51,11 @@ class TranscriptStorage:
         filename = transcript.filename
         filepath = self.storage_dir / filename
 
-        # Convert to JSON-serializable dict
-        transcript_dict = transcript.model_dump(mode="json")
+        # Serialize straight to JSON in pydantic-core (no intermediate dict)
+        transcript_json = transcript.model_dump_json(indent=self.indent)
 
-        # Write to file asynchronously
-        async with aiofiles.open(filepath, "w") as f:
-            await f.write(json.dumps(transcript_dict, indent=2))
+        # Write in one worker-thread hop (open, write and close together)
+        await asyncio.to_thread(filepath.write_text, transcript_json, encoding="utf-8")
 
         logger.debug(
             "Transcript stored",
@@ -86,11 +89,11 @@ class TranscriptStorage:
         if not filepath.exists():
             raise FileNotFoundError(f"Transcript not found: {filename}")
 
-        async with aiofiles.open(filepath) as f:
-            content = await f.read()
-            data = json.loads(content)
+        # Read raw bytes in one worker-thread hop; pydantic-core decodes UTF-8
+        content = await asyncio.to_thread(filepath.read_bytes)
 
-        return ConversationTranscript(**data)
+        # Parse and validate in one pass (ValidationError is a ValueError)
+        return ConversationTranscript.model_validate_json(content)
 
     async def list_transcripts(
         self,
@@ -104,11 +107,20 @@ class TranscriptStorage:
         Returns:
             List of filenames sorted by modification time (newest first)
         """
-        # Get all JSON files in storage directory
-        files = list(self.storage_dir.glob("*.json"))
+        return await asyncio.to_thread(self._list_transcripts_sync, limit)
 
-        # Sort by modification time (newest first)
-        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    def _list_transcripts_sync(self, limit: int) -> list[str]:
+        """Scan the storage directory (runs in a worker thread).
 
-        # Return filenames (not full paths)
-        return [f.name for f in files[:limit]]
+        A single os.scandir pass filters on the directory entry (no Path
+        objects or glob matching) and stats each transcript once.
+        """
+        with os.scandir(self.storage_dir) as it:
+            entries = [
+                (entry.stat().st_mtime, entry.name)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+        # Newest first; only the requested number of filenames is sorted out
+        return [name for _, name in heapq.nlargest(limit, entries)]
@@ -236,14 +236,17 @@ class ConversationTracker:
         )
         self._metadata[conversation_id] = metadata
 
-        logger.debug(
-            "Created new conversation metadata",
-            extra={
-                "conversation_id": conversation_id,
-                "message_count": message_count,
-                "start_time": current_time.isoformat(),
-            },
-        )
+        # Metadata is created or updated on every chat request: skip building
+        # the extra dict (and the isoformat call) unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Created new conversation metadata",
+                extra={
+                    "conversation_id": conversation_id,
+                    "message_count": message_count,
+                    "start_time": current_time.isoformat(),
+                },
+            )
 
     def _update_metadata(
         self,
@@ -274,14 +277,15 @@ class ConversationTracker:
             start_time=metadata.start_time,  # Keep original start time
         )
 
-        logger.debug(
-            "Updated conversation metadata",
-            extra={
-                "conversation_id": conversation_id,
-                "message_count": message_count,
-                "last_seen": current_time.isoformat(),
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updated conversation metadata",
+                extra={
+                    "conversation_id": conversation_id,
+                    "message_count": message_count,
+                    "last_seen": current_time.isoformat(),
+                },
+            )
 
     def _update_access_order(self, conversation_id: str) -> None:
         """Update LRU access order for a conversation.
@@ -347,7 +351,6 @@ class ConversationTracker:
             messages=extraction_messages,
             start_time=tracker_transcript.start_time,
             end_time=tracker_transcript.end_time,
-            message_count=tracker_transcript.message_count,
         )
 
     async def _handle_boundary_detection(
@@ -368,21 +371,19 @@ class ConversationTracker:
         # Create transcript from message history
         messages_data = self._message_history.get(conversation_id, [])
 
-        # Convert to ChatMessage models with timestamps
-        chat_messages = []
-        for i, msg in enumerate(messages_data):
-            # Estimate timestamps (spread evenly across conversation duration)
-            duration = (current_time - current_metadata.start_time).total_seconds()
-            msg_offset = (duration / len(messages_data)) * i if messages_data else 0
-            msg_time = current_metadata.start_time + timedelta(seconds=msg_offset)
-
-            chat_messages.append(
-                ChatMessage(
-                    role=msg.get("role", "user"),
-                    content=msg.get("content", ""),
-                    timestamp=msg_time,
-                )
+        # Convert to ChatMessage models with timestamps estimated by spreading
+        # the messages evenly across the conversation duration
+        start_time = current_metadata.start_time
+        duration = (current_time - start_time).total_seconds()
+        step = duration / len(messages_data) if messages_data else 0.0
+        chat_messages = [
+            ChatMessage(
+                role=msg.get("role", "user"),
+                content=msg.get("content", ""),
+                timestamp=start_time + timedelta(seconds=step * i),
             )
+            for i, msg in enumerate(messages_data)
+        ]
 
         if not chat_messages:
             logger.warning(
@@ -414,7 +415,9 @@ class ConversationTracker:
                 current_message_count=len(messages_data),
                 message_count_drop_percent=result.message_count_drop_percent,
                 previous_first_hash=current_metadata.first_message_hash,
-                current_first_hash=compute_first_message_hash(messages_data),
+                # The stored history and its first-message hash are always
+                # updated together, so the hash is already on the metadata
+                current_first_hash=current_metadata.first_message_hash,
                 hash_changed=result.hash_changed,
                 trigger_reason=result.reason or BoundaryTriggerReason.IDLE_AND_MESSAGE_DROP,
                 transcript_filename=filename,
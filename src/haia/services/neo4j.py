@@ -8,13 +8,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import time
 from typing import Any, Optional
 
 from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j.exceptions import ClientError
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Below this many candidate vectors an exact scan beats HNSW graph traversal
+BRUTE_FORCE_MAX_CANDIDATES = 500
+
+# How long a cached candidate-count estimate stays valid (seconds)
+PARTITION_SIZE_TTL = 300.0
+
+# vector.similarity.cosine(), used by the exact scan, ships with Neo4j 5.18
+VECTOR_FUNCTIONS_MIN_VERSION = (5, 18)
+
 
 class Neo4jService:
     """Async Neo4j database service with CRUD operations.
@@ -35,6 +47,10 @@ class Neo4jService:
         self.user = user
         self.driver: Optional[AsyncDriver] = None
         self._password = password
+        # Candidate counts per search filter: (memory_types, min_confidence) -> (count, fetched_at)
+        self._partition_sizes: dict[tuple, tuple[int, float]] = {}
+        # Exact-scan search path, enabled by connect() once the server version allows it
+        self._brute_force_supported = False
         logger.info(f"Neo4j service initialized with URI: {uri}")
 
     async def connect(self, max_retries: int = 5) -> None:
@@ -58,6 +74,7 @@ class Neo4jService:
                 # Verify connectivity
                 await self.driver.verify_connectivity()
                 logger.info(f"Connected to Neo4j at {self.uri}")
+                await self._detect_vector_functions()
                 return
             except Exception as e:
                 if attempt < max_retries:
@@ -72,6 +89,50 @@ class Neo4jService:
                     logger.error(f"Failed to connect to Neo4j after {max_retries} attempts")
                     raise
 
+    async def _detect_vector_functions(self) -> None:
+        """Enable the exact-scan search path if the server has vector functions.
+
+        Reads the kernel version from dbms.components(). Anything older than
+        VECTOR_FUNCTIONS_MIN_VERSION, or a version that can't be read, keeps
+        searches on the HNSW index.
+        """
+        try:
+            async with self.driver.session() as session:
+                result = await session.run(
+                    "CALL dbms.components() YIELD name, versions "
+                    "WHERE name = 'Neo4j Kernel' RETURN versions[0] AS version"
+                )
+                record = await result.single()
+            version = str(record["version"]) if record else ""
+        except Exception as e:
+            logger.warning(f"Could not read Neo4j version, using HNSW index only: {e}")
+            self._brute_force_supported = False
+            return
+
+        match = re.match(r"(\d+)\.(\d+)", version)
+        self._brute_force_supported = (
+            match is not None
+            and (int(match.group(1)), int(match.group(2))) >= VECTOR_FUNCTIONS_MIN_VERSION
+        )
+        logger.info(
+            f"Neo4j version {version or 'unknown'}: exact vector scan "
+            f"{'enabled' if self._brute_force_supported else 'disabled'}"
+        )
+
+    @property
+    def exact_search_enabled(self) -> bool:
+        """Whether small searches can use the exact cosine scan (Neo4j 5.18+)."""
+        return self._brute_force_supported
+
+    @staticmethod
+    def _is_unknown_function_error(error: Exception) -> bool:
+        """Check whether a query failed because a Cypher function doesn't exist."""
+        return (
+            isinstance(error, ClientError)
+            and error.code == "Neo.ClientError.Statement.SyntaxError"
+            and "Unknown function" in (error.message or "")
+        )
+
     async def close(self) -> None:
         """Close Neo4j driver connection."""
         if self.driver:
@@ -604,15 +665,29 @@ class Neo4jService:
         min_confidence: float = 0.4,
         min_similarity: float = 0.65,
         memory_types: Optional[list[str]] = None,
+        size_hint: Optional[int] = None,
+        relevance_weights: Optional[dict[str, Any]] = None,
     ) -> list[dict[str, Any]]:
         """Search for similar memories using vector similarity.
 
+        Uses the HNSW vector index for large candidate sets, and an exact
+        cosine scan when the filtered candidate set is small enough that
+        graph traversal costs more than it saves. The exact scan (and the
+        candidate count that selects it) only runs on Neo4j 5.18+.
+
         Args:
             query_vector: Query embedding vector (768 dimensions)
             top_k: Number of results to return
             min_confidence: Minimum extraction confidence threshold
             min_similarity: Minimum cosine similarity threshold
             memory_types: Optional filter by memory types
+            size_hint: Known number of candidate memories for these filters
+                (estimated with a cached count query when omitted)
+            relevance_weights: Optional relevance parameters (similarity_weight,
+                confidence_weight, recency_weight, recency_decay_days,
+                type_weights, neutral_recency, default_type_weight). When given,
+                results are ranked by relevance in the query and carry a
+                ``relevance_score`` column.
 
         Returns:
             List of memory dictionaries with similarity scores
@@ -621,19 +696,135 @@ class Neo4jService:
             logger.error("Cannot search memories: Driver not initialized")
             return []
 
+        if size_hint is None and self._brute_force_supported:
+            size_hint = await self._estimate_partition_size(memory_types, min_confidence)
+        use_brute_force = (
+            self._brute_force_supported
+            and size_hint is not None
+            and size_hint <= BRUTE_FORCE_MAX_CANDIDATES
+        )
+
         # Retrieve more results initially to allow for filtering
         search_k = top_k * 2
+        rank_by_relevance = relevance_weights is not None
 
-        query = """
+        try:
+            async with self.driver.session() as session:
+                try:
+                    result = await session.run(
+                        self._build_search_query(use_brute_force, memory_types, rank_by_relevance),
+                        search_k=search_k,
+                        query_vector=query_vector,
+                        min_confidence=min_confidence,
+                        min_similarity=min_similarity,
+                        memory_types=memory_types,
+                        top_k=top_k,
+                        relevance=relevance_weights,
+                    )
+                    records = [record.data() async for record in result]
+                except Exception as e:
+                    if not use_brute_force:
+                        raise
+                    if self._is_unknown_function_error(e):
+                        # Server lacks vector.similarity.cosine() - stick to the index
+                        logger.warning(
+                            f"Brute-force vector scan unavailable, using HNSW index: {e}"
+                        )
+                        self._brute_force_supported = False
+                    else:
+                        logger.warning(f"Brute-force vector scan failed, retrying with HNSW: {e}")
+                    use_brute_force = False
+                    result = await session.run(
+                        self._build_search_query(False, memory_types, rank_by_relevance),
+                        search_k=search_k,
+                        query_vector=query_vector,
+                        min_confidence=min_confidence,
+                        min_similarity=min_similarity,
+                        memory_types=memory_types,
+                        top_k=top_k,
+                        relevance=relevance_weights,
+                    )
+                    records = [record.data() async for record in result]
+
+                logger.debug(
+                    f"Found {len(records)} similar memories (top_k={top_k}, "
+                    f"path={'brute-force' if use_brute_force else 'hnsw'}, "
+                    f"candidates~{size_hint})"
+                )
+                return records
+        except Exception as e:
+            logger.error(f"Failed to search similar memories: {e}")
+            return []
+
+    @staticmethod
+    def _build_search_query(
+        use_brute_force: bool,
+        memory_types: Optional[list[str]],
+        rank_by_relevance: bool = False,
+    ) -> str:
+        """Build the Cypher query for a similarity search.
+
+        Args:
+            use_brute_force: Scan matching nodes with exact cosine similarity
+                instead of querying the HNSW vector index
+            memory_types: Optional filter by memory types
+            rank_by_relevance: Compute the weighted relevance score in Cypher
+                (from the $relevance parameter map) and order by it
+
+        Returns:
+            Cypher query string
+
+        Note:
+            Timestamps are returned as epoch milliseconds so the driver hands
+            back plain ints instead of hydrating neo4j.time.DateTime objects.
+        """
+        if use_brute_force:
+            query = """
+        MATCH (memory:Memory)
+        WHERE memory.embedding IS NOT NULL
+          AND memory.confidence >= $min_confidence
+        """
+            if memory_types:
+                query += " AND memory.memory_type IN $memory_types"
+            query += """
+        WITH memory, vector.similarity.cosine(memory.embedding, $query_vector) AS score
+        WHERE score >= $min_similarity
+        """
+        else:
+            query = """
         CALL db.index.vector.queryNodes('memory_embeddings', $search_k, $query_vector)
         YIELD node AS memory, score
         WHERE memory.confidence >= $min_confidence
           AND score >= $min_similarity
         """
 
-        # Add memory type filter if specified
-        if memory_types:
-            query += " AND memory.memory_type IN $memory_types"
+            # Add memory type filter if specified
+            if memory_types:
+                query += " AND memory.memory_type IN $memory_types"
+
+        if rank_by_relevance:
+            # (α·similarity + β·confidence + γ·recency) · type_weight, clamped to [0, 1];
+            # recency = exp(-days / decay_days), neutral without a timestamp
+            query += """
+        WITH memory, score,
+          CASE
+            WHEN memory.extraction_timestamp IS NULL THEN $relevance.neutral_recency
+            ELSE exp(
+              -duration.inSeconds(datetime(memory.extraction_timestamp), datetime()).seconds
+              / 86400.0 / $relevance.recency_decay_days
+            )
+          END AS recency
+        WITH memory, score,
+          ($relevance.similarity_weight * score
+            + $relevance.confidence_weight * memory.confidence
+            + $relevance.recency_weight * CASE WHEN recency > 1.0 THEN 1.0 ELSE recency END)
+          * coalesce(
+              $relevance.type_weights[memory.memory_type], $relevance.default_type_weight
+            ) AS relevance
+        WITH memory, score,
+          CASE WHEN relevance > 1.0 THEN 1.0 WHEN relevance < 0.0 THEN 0.0 ELSE relevance END
+            AS relevance
+        """
 
         query += """
         RETURN
@@ -642,35 +833,95 @@ class Neo4jService:
           memory.content AS content,
           memory.confidence AS confidence,
           memory.source_conversation_id AS source_conversation_id,
-          memory.extraction_timestamp AS extraction_timestamp,
+          datetime(memory.extraction_timestamp).epochMillis AS extraction_timestamp,
           memory.category AS category,
           memory.metadata AS metadata,
           memory.embedding AS embedding,
           memory.has_embedding AS has_embedding,
           memory.embedding_version AS embedding_version,
-          memory.embedding_updated_at AS embedding_updated_at,
-          score AS similarity_score
+          datetime(memory.embedding_updated_at).epochMillis AS embedding_updated_at,
+          score AS similarity_score"""
+
+        if rank_by_relevance:
+            query += """,
+          relevance AS relevance_score
+        ORDER BY relevance DESC, score DESC
+        LIMIT $top_k
+        """
+        else:
+            query += """
         ORDER BY score DESC
         LIMIT $top_k
         """
+        return query
+
+    async def warmup_search(
+        self,
+        memory_types: Optional[list[str]] = None,
+        min_confidence: float = 0.4,
+    ) -> Optional[int]:
+        """Prepare a similarity search before its query vector is available.
+
+        Runs (or reuses) the candidate count that selects between the exact
+        scan and the HNSW index, so callers can overlap it with embedding
+        generation and pass the result to search_similar_memories() as
+        size_hint. Only useful while exact_search_enabled is True.
+
+        Args:
+            memory_types: Optional filter by memory types
+            min_confidence: Minimum extraction confidence threshold
+
+        Returns:
+            Number of candidate memories, or None if unknown/not needed
+        """
+        if not self.driver or not self._brute_force_supported:
+            return None
+        return await self._estimate_partition_size(memory_types, min_confidence)
+
+    async def _estimate_partition_size(
+        self,
+        memory_types: Optional[list[str]],
+        min_confidence: float,
+    ) -> Optional[int]:
+        """Count embedded memories matching the search filters (cached).
+
+        Args:
+            memory_types: Optional filter by memory types
+            min_confidence: Minimum extraction confidence threshold
+
+        Returns:
+            Number of candidate memories, or None if the count failed
+        """
+        key = (tuple(sorted(memory_types)) if memory_types else None, min_confidence)
+        cached = self._partition_sizes.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < PARTITION_SIZE_TTL:
+            return cached[0]
+
+        query = """
+        MATCH (memory:Memory)
+        WHERE memory.embedding IS NOT NULL
+          AND memory.confidence >= $min_confidence
+        """
+        if memory_types:
+            query += " AND memory.memory_type IN $memory_types"
+        query += " RETURN count(memory) AS total"
 
         try:
             async with self.driver.session() as session:
                 result = await session.run(
                     query,
-                    search_k=search_k,
-                    query_vector=query_vector,
                     min_confidence=min_confidence,
-                    min_similarity=min_similarity,
                     memory_types=memory_types,
-                    top_k=top_k,
                 )
-                records = [record.data() async for record in result]
-                logger.debug(f"Found {len(records)} similar memories (top_k={top_k})")
-                return records
+                record = await result.single()
+                total = int(record["total"]) if record else 0
         except Exception as e:
-            logger.error(f"Failed to search similar memories: {e}")
-            return []
+            logger.warning(f"Failed to estimate search partition size: {e}")
+            return None
+
+        self._partition_sizes[key] = (total, now)
+        return total
 
     async def store_embedding(
         self,
@@ -810,6 +1061,56 @@ class Neo4jService:
             logger.error(f"Failed to record memory access: {e}", exc_info=True)
             return 0
 
+    async def record_memory_access_counts(
+        self,
+        accesses: list[dict[str, Any]],
+    ) -> int:
+        """Record buffered accesses for many memories in one round-trip.
+
+        Args:
+            accesses: Rows of {"memory_id": str, "count": int,
+                "last_accessed": datetime} aggregated since the last write
+
+        Returns:
+            Number of memories successfully updated
+        """
+        if not self.driver:
+            raise RuntimeError("Not connected to Neo4j")
+
+        if not accesses:
+            return 0
+
+        rows = [
+            {
+                "memory_id": row["memory_id"],
+                "count": row["count"],
+                "last_accessed": row["last_accessed"].isoformat(),
+            }
+            for row in accesses
+        ]
+
+        query = """
+        UNWIND $rows AS row
+        MATCH (m) WHERE m.memory_id = row.memory_id
+        SET m.last_accessed = datetime(row.last_accessed),
+            m.access_count = coalesce(m.access_count, 0) + row.count
+        RETURN count(m) as updated_count
+        """
+
+        try:
+            async with self.driver.session() as session:
+                result = await session.run(query, rows=rows)
+                record = await result.single()
+                updated_count = record["updated_count"] if record else 0
+
+                logger.debug(f"Recorded buffered access for {updated_count} memories")
+
+                return updated_count
+
+        except Exception as e:
+            logger.error(f"Failed to record buffered memory access: {e}", exc_info=True)
+            return 0
+
     async def get_access_metadata(self, memory_ids: list[str]) -> dict:
         """Get access metadata for multiple memories.
 
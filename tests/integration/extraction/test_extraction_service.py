@@ -58,7 +58,6 @@ def load_conversation(conversation_data: dict) -> ConversationTranscript:
         end_time=datetime.fromisoformat(
             conversation_data["end_time"].replace("Z", "+00:00")
         ),
-        message_count=conversation_data["message_count"],
     )
 
 
@@ -225,7 +224,6 @@ async def test_empty_conversation_no_memories(extraction_service):
         ],
         start_time=datetime.now(timezone.utc),
         end_time=datetime.now(timezone.utc),
-        message_count=2,
     )
 
     result = await extraction_service.extract_memories(transcript)
@@ -11,7 +11,7 @@ Run with: uv run pytest tests/integration/test_retrieval_integration.py -v
 import asyncio
 import os
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
 from haia.config import settings
 from haia.embedding.ollama_client import OllamaClient
@@ -329,6 +329,30 @@ async def test_retrieval_relevance_scoring(retrieval_service, sample_memories):
             assert abs(result.relevance_score - expected_relevance) < 0.01
 
 
+@pytest.mark.asyncio
+async def test_cypher_relevance_matches_python_scoring(
+    retrieval_service, neo4j_service, sample_memories, ollama_client
+):
+    """Test Neo4j's relevance_score equals the Python fallback for the same rows."""
+    query_embedding = await ollama_client.embed("homelab infrastructure")
+
+    rows = await neo4j_service.search_similar_memories(
+        query_vector=query_embedding,
+        top_k=10,
+        min_confidence=0.4,
+        min_similarity=0.0,
+        relevance_weights=retrieval_service._relevance_params,
+    )
+    assert rows
+
+    memories = [RetrievalService._dict_to_memory(row) for row in rows]
+    python_scores = retrieval_service._calculate_relevance_scores(
+        memories, [row["similarity_score"] for row in rows], datetime.now(timezone.utc)
+    )
+
+    for row, python_score in zip(rows, python_scores):
+        assert row["relevance_score"] == pytest.approx(python_score, abs=1e-3)
+
 @pytest.mark.asyncio
 async def test_retrieval_deduplication(retrieval_service, neo4j_service, ollama_client):
     """Test that near-duplicate memories are deduplicated."""
@@ -1,5 +1,7 @@
 """Unit tests for Pydantic API models validation."""
 
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
@@ -123,6 +125,25 @@ class TestChatCompletionRequest:
         assert request.messages[0].role == "system"
         assert request.messages[1].role == "user"
 
+    def test_message_dicts_built_once(self):
+        """Test message_dicts converts messages once and is not serialized."""
+        from haia.api.models.chat import ChatCompletionRequest
+
+        request = ChatCompletionRequest(
+            model="haia",
+            messages=[
+                {"role": "user", "content": "What is Docker?"},
+                {"role": "assistant", "content": "Docker is a platform."},
+            ],
+        )
+
+        assert request.message_dicts == [
+            {"role": "user", "content": "What is Docker?"},
+            {"role": "assistant", "content": "Docker is a platform."},
+        ]
+        assert request.message_dicts is request.message_dicts
+        assert "message_dicts" not in request.model_dump()
+
 
 class TestTokenUsage:
     """Tests for TokenUsage model."""
@@ -134,12 +155,12 @@ class TestTokenUsage:
         usage = TokenUsage(
             prompt_tokens=10,
             completion_tokens=20,
-            total_tokens=30,
         )
 
         assert usage.prompt_tokens == 10
         assert usage.completion_tokens == 20
         assert usage.total_tokens == 30
+        assert usage.model_dump()["total_tokens"] == 30
 
     def test_negative_tokens_fails_validation(self):
         """Test that negative token counts fail validation."""
@@ -149,14 +170,12 @@ class TestTokenUsage:
             TokenUsage(
                 prompt_tokens=-1,
                 completion_tokens=10,
-                total_tokens=9,
             )
 
         with pytest.raises(ValidationError):
             TokenUsage(
                 prompt_tokens=10,
                 completion_tokens=-1,
-                total_tokens=9,
             )
 
 
@@ -264,6 +283,21 @@ class TestStreamingModels:
         assert chunk.choices[0].delta.content == "Hello "
         assert chunk.choices[0].finish_reason is None
 
+    def test_delta_json_matches_model_serialization(self):
+        """Test delta_json produces the same JSON as the from_delta model."""
+        from haia.api.models.chat import ChatCompletionChunk
+
+        with patch("haia.api.models.chat.time.time", return_value=1677652288):
+            fast = ChatCompletionChunk.delta_json(
+                content='Say "hi" \u00e9', model="haia", chunk_id="test-123"
+            )
+            chunk = ChatCompletionChunk.from_delta(
+                content='Say "hi" \u00e9', model="haia", chunk_id="test-123"
+            )
+
+        assert fast == chunk.model_dump_json()
+        assert ChatCompletionChunk.model_validate_json(fast) == chunk
+
     def test_final_chunk_with_usage(self):
         """Test final chunk with usage statistics."""
         from haia.api.models.chat import ChatCompletionChunk, TokenUsage
@@ -274,7 +308,6 @@ class TestStreamingModels:
             usage=TokenUsage(
                 prompt_tokens=10,
                 completion_tokens=20,
-                total_tokens=30,
             ),
         )
 
@@ -268,3 +268,13 @@ class TestDetectMultiMentions:
         ]
         count = detect_multi_mentions(content, messages)
         assert count == 2
+
+    def test_key_terms_matched_literally(self):
+        """Test regex metacharacters in key terms are matched literally."""
+        content = "User deploys node.js services"
+        messages = [
+            {"content": "I use node.js at work", "speaker": "user"},
+            {"content": "nodexjs is not a thing", "speaker": "user"},
+        ]
+        count = detect_multi_mentions(content, messages)
+        assert count == 1
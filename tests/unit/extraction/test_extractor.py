@@ -0,0 +1,291 @@
+"""Unit tests for ExtractionService and transcript formatting."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from haia.extraction.extractor import ExtractionService
+from haia.extraction.models import (
+    ConversationTranscript,
+    ExtractedMemory,
+    ExtractionBatchResult,
+    ExtractionResult,
+    Message,
+)
+from haia.extraction.prompts import format_transcript
+
+
+def make_transcript(conversation_id: str = "conv_001") -> ConversationTranscript:
+    """Create a two-message transcript."""
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    return ConversationTranscript(
+        conversation_id=conversation_id,
+        messages=[
+            Message(content="I prefer Docker over Podman", timestamp=start, speaker="user"),
+            Message(
+                content="Noted.", timestamp=start + timedelta(seconds=5), speaker="assistant"
+            ),
+        ],
+        start_time=start,
+        end_time=start + timedelta(seconds=5),
+    )
+
+
+def make_service(**kwargs) -> ExtractionService:
+    """Create a service whose agent returns one memory after a short delay."""
+    service = ExtractionService(model="test", **kwargs)
+    output = ExtractionResult(
+        conversation_id="conv_001",
+        memories=[
+            ExtractedMemory(
+                memory_type="preference",
+                content="User prefers Docker over Podman",
+                confidence=0.9,
+                source_conversation_id="conv_001",
+            )
+        ],
+        extraction_duration=0.0,
+        model_used="test",
+    )
+
+    async def run(prompt):
+        await asyncio.sleep(0.01)
+        return MagicMock(output=output)
+
+    service.agent = MagicMock()
+    service.agent.run = AsyncMock(side_effect=run)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_identical_transcripts_share_one_llm_call():
+    """Test concurrent and repeated extractions of a transcript hit the LLM once."""
+    service = make_service()
+    transcript = make_transcript()
+
+    first, second = await asyncio.gather(
+        service.extract_memories(transcript), service.extract_memories(transcript)
+    )
+    third = await service.extract_memories(transcript)
+
+    assert service.agent.run.await_count == 1
+    assert first.memory_count == second.memory_count == third.memory_count == 1
+    # Each caller gets its own memory objects
+    assert first.memories[0] is not third.memories[0]
+
+    await service.extract_memories(make_transcript("conv_002"))
+    assert service.agent.run.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_shared_extraction():
+    """Test cancelling the first caller doesn't cancel callers that joined it."""
+    service = make_service()
+    transcript = make_transcript()
+
+    first = asyncio.create_task(service.extract_memories(transcript))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(service.extract_memories(transcript))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await second
+    assert result.memory_count == 1
+    assert first.cancelled()
+    assert service.agent.run.await_count == 1
+
+    # With no caller left, the shared request itself is cancelled
+    only = asyncio.create_task(service.extract_memories(make_transcript("conv_002")))
+    await asyncio.sleep(0)
+    shared = next(iter(service._inflight.values()))
+    only.cancel()
+    await asyncio.gather(only, return_exceptions=True)
+    await asyncio.gather(shared, return_exceptions=True)
+    assert shared.cancelled()
+    assert not service._inflight and not service._inflight_waiters
+
+
+@pytest.mark.asyncio
+async def test_result_cache_disabled():
+    """Test a zero cache size always calls the LLM."""
+    service = make_service(result_cache_size=0)
+    transcript = make_transcript()
+
+    await service.extract_memories(transcript)
+    await service.extract_memories(transcript)
+
+    assert service.agent.run.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_not_cached():
+    """Test LLM failures are retried on the next call."""
+    service = make_service()
+    service.agent.run.side_effect = RuntimeError("LLM unavailable")
+
+    failed = await service.extract_memories(make_transcript())
+    assert failed.error == "LLM unavailable"
+
+    service.agent.run.side_effect = None
+    service.agent.run.return_value = MagicMock(
+        output=ExtractionResult(
+            conversation_id="conv_001", memories=[], extraction_duration=0.0, model_used="test"
+        )
+    )
+    result = await service.extract_memories(make_transcript())
+    assert result.error is None
+    assert service.agent.run.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_unbatched_by_default():
+    """Test extract_batch makes one LLM call per transcript unless batch_size is raised."""
+    service = make_service()
+    service.batch_agent = MagicMock()
+    service.batch_agent.run = AsyncMock()
+
+    results = await service.extract_batch([make_transcript(f"conv_{i}") for i in range(3)])
+
+    assert len(results) == 3
+    assert service.agent.run.await_count == 3
+    service.batch_agent.run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_groups_transcripts():
+    """Test extract_batch sends batch_size transcripts per LLM call."""
+    service = make_service(batch_size=2, min_confidence=0.5)
+    transcripts = [make_transcript(f"conv_{i}") for i in range(3)]
+
+    service.batch_agent = MagicMock()
+    service.batch_agent.run = AsyncMock(
+        return_value=MagicMock(
+            output=ExtractionBatchResult(
+                results=[
+                    ExtractionResult(
+                        conversation_id=conversation_id,
+                        memories=[
+                            ExtractedMemory(
+                                memory_type="preference",
+                                content=f"Preference from {conversation_id}",
+                                confidence=confidence,
+                                source_conversation_id=conversation_id,
+                            )
+                        ],
+                        extraction_duration=0.0,
+                        model_used="test",
+                    )
+                    for conversation_id, confidence in [("conv_1", 0.9), ("conv_0", 0.45)]
+                ]
+            )
+        )
+    )
+
+    results = await service.extract_batch(transcripts)
+
+    # One batched call for [conv_0, conv_1], a single extraction for conv_2
+    assert service.batch_agent.run.await_count == 1
+    assert service.agent.run.await_count == 1
+    assert [r.conversation_id for r in results] == ["conv_0", "conv_1", "conv_2"]
+    # min_confidence still applies to batched output
+    assert [r.memory_count for r in results] == [0, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_rejects_swapped_conversation_ids():
+    """Test batched output whose memories belong to another conversation is not trusted."""
+    service = make_service(batch_size=2)
+    transcripts = [make_transcript(f"conv_{i}") for i in range(2)]
+
+    def batch_result(conversation_id: str, source_id: str) -> ExtractionResult:
+        return ExtractionResult(
+            conversation_id=conversation_id,
+            memories=[
+                ExtractedMemory(
+                    memory_type="preference",
+                    content=f"Preference from {source_id}",
+                    confidence=0.9,
+                    source_conversation_id=source_id,
+                )
+            ],
+            extraction_duration=0.0,
+            model_used="test",
+        )
+
+    service.batch_agent = MagicMock()
+    service.batch_agent.run = AsyncMock(
+        return_value=MagicMock(
+            output=ExtractionBatchResult(
+                results=[
+                    # conv_0 came back holding conv_1's memory
+                    batch_result("conv_0", "conv_1"),
+                    batch_result("conv_1", "conv_1"),
+                    batch_result("conv_9", "conv_9"),
+                ]
+            )
+        )
+    )
+
+    results = await service.extract_batch(transcripts)
+
+    # conv_0 is re-extracted on its own; conv_9 isn't in the batch and is ignored
+    assert service.agent.run.await_count == 1
+    assert [r.conversation_id for r in results] == ["conv_0", "conv_1"]
+    assert results[0].memories[0].content == "User prefers Docker over Podman"
+    assert results[1].memories[0].content == "Preference from conv_1"
+    # The rejected output never reaches the single-transcript cache
+    _, cached = service._result_cache[service._cache_key(format_transcript(transcripts[0]))]
+    assert cached.memories[0].source_conversation_id == "conv_001"
+
+@pytest.mark.asyncio
+async def test_extract_batch_falls_back_on_failure():
+    """Test a failed batched call extracts each transcript individually."""
+    service = make_service(batch_size=4)
+    transcripts = [make_transcript(f"conv_{i}") for i in range(2)]
+
+    service.batch_agent = MagicMock()
+    service.batch_agent.run = AsyncMock(side_effect=ValueError("bad batch output"))
+
+    results = await service.extract_batch(transcripts)
+
+    assert service.agent.run.await_count == 2
+    assert all(r.is_successful for r in results)
+    assert [r.conversation_id for r in results] == ["conv_0", "conv_1"]
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_fallbacks_respect_max_concurrency():
+    """Test individual fallback calls share the max_concurrency limit."""
+    service = make_service(batch_size=4)
+    transcripts = [make_transcript(f"conv_{i}") for i in range(4)]
+    active = peak = 0
+    output = service.agent.run.side_effect
+
+    async def tracked_run(prompt):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            return await output(prompt)
+        finally:
+            active -= 1
+
+    service.agent.run.side_effect = tracked_run
+    service.batch_agent = MagicMock()
+    service.batch_agent.run = AsyncMock(side_effect=ValueError("bad batch output"))
+
+    results = await service.extract_batch(transcripts, max_concurrency=2)
+
+    assert service.agent.run.await_count == 4
+    assert all(r.is_successful for r in results)
+    assert peak == 2
+
+
+def test_format_transcript_message_lines():
+    """Test messages are formatted as numbered HH:MM:SS lines."""
+    lines = format_transcript(make_transcript()).split("\n")
+
+    assert "[1] 12:00:00 - user: I prefer Docker over Podman" in lines
+    assert "[2] 12:00:05 - assistant: Noted." in lines
@@ -1,6 +1,7 @@
 """Unit tests for extraction models."""
 
 from datetime import datetime, timezone
+from typing import get_args
 
 import pytest
 from pydantic import ValidationError
@@ -11,6 +12,7 @@ from haia.extraction.models import (
     ExtractionResult,
     Message,
     MemoryCategory,
+    MemoryType,
     ConfidenceLevel,
 )
 
@@ -52,7 +54,6 @@ class TestConversationTranscript:
             ],
             start_time=now,
             end_time=now,
-            message_count=2,
         )
         assert transcript.conversation_id == "test_001"
         assert len(transcript.messages) == 2
@@ -67,7 +68,6 @@ class TestConversationTranscript:
             messages=[Message(content="Test", timestamp=start, speaker="user")],
             start_time=start,
             end_time=end,
-            message_count=1,
         )
         assert transcript.duration_seconds == 330.0  # 5 minutes 30 seconds
 
@@ -80,7 +80,6 @@ class TestConversationTranscript:
                 messages=[],  # Empty list should fail
                 start_time=now,
                 end_time=now,
-                message_count=0,
             )
 
 
@@ -161,6 +160,29 @@ class TestExtractedMemory:
         )
         assert memory_with_meta.metadata["is_explicit"] is True
 
+    def test_from_trusted_matches_validated(self):
+        """Test from_trusted builds the same memory without re-validating."""
+        memory = ExtractedMemory(
+            memory_type="preference",
+            content="User prefers Docker",
+            confidence=0.8,
+            source_conversation_id="conv_007",
+        )
+
+        assert ExtractedMemory.from_trusted(memory.model_dump()) == memory
+
+        # Defaults still apply to omitted fields
+        partial = ExtractedMemory.from_trusted(
+            {"memory_id": memory.memory_id, "content": memory.content}
+        )
+        assert partial.access_count == 0
+        assert partial.metadata == {}
+
+
+    def test_memory_type_matches_memory_category(self):
+        """Test the memory_type Literal and MemoryCategory enum list the same values."""
+        assert set(get_args(MemoryType)) == {category.value for category in MemoryCategory}
+
 
 class TestExtractionResult:
     """Tests for ExtractionResult model."""
@@ -244,6 +266,21 @@ class TestExtractionResult:
         }
         assert result.high_confidence_count == 2  # 0.85 and 0.75
 
+        # Summary is computed once and included in serialization
+        dumped = result.model_dump()
+        assert dumped["average_confidence"] == pytest.approx((0.85 + 0.75 + 0.65) / 3)
+        assert dumped["memory_types_distribution"] == result.memory_types_distribution
+
+    def test_extraction_result_is_frozen(self):
+        """Test results are immutable so cached statistics can't go stale."""
+        result = ExtractionResult(
+            conversation_id="conv_005",
+            extraction_duration=1.0,
+            model_used="claude-haiku-4-5-20251001",
+        )
+        with pytest.raises(ValidationError):
+            result.memories = []
+
 
 class TestConfidenceLevel:
     """Tests for ConfidenceLevel enum."""
@@ -262,3 +299,38 @@ class TestConfidenceLevel:
         """Test low confidence level."""
         assert ConfidenceLevel.from_score(0.3) == ConfidenceLevel.LOW
         assert ConfidenceLevel.from_score(0.0) == ConfidenceLevel.LOW
+
+    def test_summary_follows_memory_changes(self):
+        """Test copies and in-place edits never report a stale summary."""
+        result = ExtractionResult(
+            conversation_id="conv_006",
+            memories=[
+                ExtractedMemory(
+                    memory_type="preference",
+                    content="Docker",
+                    confidence=0.9,
+                    source_conversation_id="conv_006",
+                )
+            ],
+            extraction_duration=1.0,
+            model_used="claude-haiku-4-5-20251001",
+        )
+        assert result.average_confidence == 0.9
+
+        emptied = result.model_copy(update={"memories": []})
+        assert emptied.memory_count == 0
+        assert emptied.average_confidence == 0.0
+        assert emptied.memory_types_distribution == {}
+        assert result.average_confidence == 0.9
+
+        result.memories.append(
+            ExtractedMemory(
+                memory_type="decision",
+                content="Use Neo4j",
+                confidence=0.5,
+                source_conversation_id="conv_006",
+            )
+        )
+        assert result.average_confidence == pytest.approx(0.7)
+        assert result.high_confidence_count == 1
+        assert result.memory_types_distribution == {"preference": 1, "decision": 1}
@@ -0,0 +1,79 @@
+"""Unit tests for AccessTracker write-behind buffering."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from haia.context.access_tracker import AccessTracker
+
+
+@pytest.fixture
+def mock_neo4j_service():
+    """Mock Neo4j service for testing."""
+    service = AsyncMock()
+    service.record_memory_access_counts = AsyncMock(side_effect=lambda rows: len(rows))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_buffer_access_defers_writes(mock_neo4j_service):
+    """Test accesses below the thresholds are only buffered."""
+    tracker = AccessTracker(mock_neo4j_service, flush_threshold=10, flush_interval_seconds=60)
+
+    written = await tracker.buffer_access(["mem_001", "mem_002"])
+
+    assert written == 0
+    mock_neo4j_service.record_memory_access_counts.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_buffer_access_aggregates_counts(mock_neo4j_service):
+    """Test repeated accesses are aggregated into one row per memory."""
+    tracker = AccessTracker(mock_neo4j_service, flush_threshold=10, flush_interval_seconds=60)
+
+    await tracker.buffer_access(["mem_001", "mem_002"])
+    await tracker.buffer_access(["mem_001"])
+    written = await tracker.flush()
+
+    assert written == 2
+    rows = mock_neo4j_service.record_memory_access_counts.call_args.args[0]
+    counts = {row["memory_id"]: row["count"] for row in rows}
+    assert counts == {"mem_001": 2, "mem_002": 1}
+
+
+@pytest.mark.asyncio
+async def test_buffer_access_flushes_at_threshold(mock_neo4j_service):
+    """Test reaching the buffered memory threshold triggers a single write."""
+    tracker = AccessTracker(mock_neo4j_service, flush_threshold=2, flush_interval_seconds=60)
+
+    await tracker.buffer_access(["mem_001"])
+    written = await tracker.buffer_access(["mem_002"])
+
+    assert written == 2
+    mock_neo4j_service.record_memory_access_counts.assert_awaited_once()
+    assert await tracker.flush() == 0  # Buffer was emptied
+
+
+@pytest.mark.asyncio
+async def test_buffer_access_flushes_after_interval(mock_neo4j_service):
+    """Test buffered accesses are written after the interval with no further accesses."""
+    tracker = AccessTracker(mock_neo4j_service, flush_threshold=10, flush_interval_seconds=0.01)
+
+    assert await tracker.buffer_access(["mem_001"]) == 0
+    await asyncio.sleep(0.05)
+
+    mock_neo4j_service.record_memory_access_counts.assert_awaited_once()
+    assert await tracker.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_and_stops_timer(mock_neo4j_service):
+    """Test close() writes pending accesses and cancels the interval timer."""
+    tracker = AccessTracker(mock_neo4j_service, flush_threshold=10, flush_interval_seconds=0.01)
+
+    await tracker.buffer_access(["mem_001"])
+    await tracker.close()
+    await asyncio.sleep(0.05)
+
+    mock_neo4j_service.record_memory_access_counts.assert_awaited_once()
@@ -37,6 +37,14 @@ class TestComputeFirstMessageHash:
         assert len(hash_value) == 64
         assert all(c in "0123456789abcdef" for c in hash_value)
 
+    def test_hash_long_message_length_change(self):
+        """Long messages differing only past the hashed prefix still differ by length."""
+        prefix = "x" * 10_000
+        messages1 = [{"role": "system", "content": prefix}]
+        messages2 = [{"role": "system", "content": prefix + " extra instructions"}]
+
+        assert compute_first_message_hash(messages1) != compute_first_message_hash(messages2)
+
     def test_empty_messages_raises_index_error(self):
         """Empty message list raises IndexError."""
         with pytest.raises(IndexError):
@@ -0,0 +1,87 @@
+"""Unit tests for the persistent SQLite embedding cache."""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from haia.embedding.cache import EmbeddingCache
+
+
+def test_put_and_get_roundtrip(tmp_path):
+    """Test stored vectors come back as float32 arrays."""
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+    key = EmbeddingCache.make_key("nomic-embed-text", "User prefers Docker")
+
+    cache.put(key, [0.25] * 768, model="nomic-embed-text")
+    vector = cache.get(key)
+
+    assert vector is not None
+    assert vector.dtype == np.float32
+    assert vector.shape == (768,)
+    assert vector[0] == 0.25
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_get_missing_key(tmp_path):
+    """Test cache misses return None."""
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+
+    assert cache.get(EmbeddingCache.make_key("nomic-embed-text", "unknown")) is None
+    cache.close()
+
+
+def test_cache_survives_reopen(tmp_path):
+    """Test entries persist across cache instances."""
+    path = tmp_path / "cache.sqlite3"
+    key = EmbeddingCache.make_key("nomic-embed-text", "Persisted text")
+
+    cache = EmbeddingCache(path)
+    cache.put(key, np.ones(768, dtype=np.float32))
+    cache.close()
+
+    reopened = EmbeddingCache(path)
+    assert reopened.get(key) is not None
+    reopened.close()
+
+
+def test_make_key_depends_on_model():
+    """Test the same text embedded by different models gets different keys."""
+    assert EmbeddingCache.make_key("model-a", "text") != EmbeddingCache.make_key(
+        "model-b", "text"
+    )
+
+
+def test_prune_evicts_oldest_beyond_max_entries(tmp_path):
+    """Test the oldest entries are evicted once max_entries is exceeded."""
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3", max_entries=2, max_age_seconds=None)
+    keys = [EmbeddingCache.make_key("nomic-embed-text", f"text {i}") for i in range(3)]
+
+    for i, key in enumerate(keys):
+        with patch("haia.embedding.cache.time.time", return_value=1_000_000 + i):
+            cache.put(key, [0.5] * 768)
+
+    assert cache.prune() == 1
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is not None
+    cache.close()
+
+
+def test_expired_entries_evicted_on_open(tmp_path):
+    """Test entries older than max_age_seconds are dropped when the cache opens."""
+    path = tmp_path / "cache.sqlite3"
+    old_key = EmbeddingCache.make_key("nomic-embed-text", "Old text")
+    new_key = EmbeddingCache.make_key("nomic-embed-text", "New text")
+
+    cache = EmbeddingCache(path)
+    with patch("haia.embedding.cache.time.time", return_value=1_000_000):
+        cache.put(old_key, [0.5] * 768)
+    cache.put(new_key, [0.5] * 768)
+    cache.close()
+
+    reopened = EmbeddingCache(path, max_age_seconds=3600)
+    assert reopened.get(old_key) is None
+    assert reopened.get(new_key) is not None
+    assert len(reopened) == 1
+    reopened.close()
@@ -305,6 +305,8 @@ def test_embedding_error_validation():
     assert error.error_type == "connection_error"
     assert error.recoverable is True
     assert error.retry_count == 2
+    assert error.timestamp.tzinfo is not None
+    assert "timestamp" in error.model_dump()
 
 
 def test_embedding_error_types():
@@ -0,0 +1,35 @@
+"""Unit tests for LLM error classes."""
+
+import contextvars
+
+from haia.llm.errors import LLMError, RateLimitError, correlation_id_var
+
+
+class TestCorrelationId:
+    """Tests for error correlation IDs."""
+
+    def test_generated_id_shared_within_context(self):
+        """Test errors raised in one context share the generated correlation ID."""
+
+        def raise_twice() -> tuple[str, str]:
+            first = LLMError("first failure")
+            second = RateLimitError("second failure")
+            return first.correlation_id, second.correlation_id
+
+        first_id, second_id = contextvars.copy_context().run(raise_twice)
+        assert first_id == second_id
+
+        # A separate context gets its own ID
+        other_id, _ = contextvars.copy_context().run(raise_twice)
+        assert other_id != first_id
+
+    def test_explicit_and_context_ids_take_precedence(self):
+        """Test explicit and context-set correlation IDs are used as given."""
+
+        def run() -> tuple[str, str]:
+            correlation_id_var.set("request-123")
+            from_context = LLMError("boom").correlation_id
+            explicit = LLMError("boom", correlation_id="explicit").correlation_id
+            return from_context, explicit
+
+        assert contextvars.Context().run(run) == ("request-123", "explicit")
@@ -7,6 +7,7 @@ a running Neo4j instance.
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from neo4j.exceptions import Neo4jError
 
 from haia.services.neo4j import Neo4jService
 
@@ -342,3 +343,108 @@ class TestNeo4jServiceErrorHandling:
 
         success = await neo4j_service.link_person_interest("person_001", "interest_001")
         assert success is False
+
+
+class TestNeo4jServiceVectorSearch:
+    """Tests for vector similarity search query selection."""
+
+    def test_build_search_query_hnsw(self, neo4j_service):
+        """Test large candidate sets query the HNSW vector index."""
+        query = neo4j_service._build_search_query(False, ["preference"])
+        assert "db.index.vector.queryNodes" in query
+        assert "memory.memory_type IN $memory_types" in query
+
+    def test_build_search_query_brute_force(self, neo4j_service):
+        """Test small candidate sets use an exact cosine scan."""
+        query = neo4j_service._build_search_query(True, None)
+        assert "vector.similarity.cosine" in query
+        assert "db.index.vector.queryNodes" not in query
+        assert "$memory_types" not in query
+
+    def test_build_search_query_relevance_ranking(self, neo4j_service):
+        """Test relevance ranking is computed and ordered in Cypher."""
+        query = neo4j_service._build_search_query(False, None, rank_by_relevance=True)
+        assert "$relevance.type_weights" in query
+        assert "relevance AS relevance_score" in query
+        assert "ORDER BY relevance DESC" in query
+
+        plain = neo4j_service._build_search_query(False, None)
+        assert "relevance_score" not in plain
+        assert "ORDER BY score DESC" in plain
+
+    @staticmethod
+    def _driver_with_session(session):
+        """Build a driver mock whose session() works as an async context manager."""
+        driver = MagicMock()
+        driver.session.return_value.__aenter__.return_value = session
+        return driver
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("version", "supported"),
+        [("5.15.0", False), ("5.18.0", True), ("2025.01.0", True), ("dev", False)],
+    )
+    async def test_detect_vector_functions_version_gate(self, neo4j_service, version, supported):
+        """Test the exact-scan path is only enabled on Neo4j 5.18+."""
+        session = AsyncMock()
+        session.run.return_value.single = AsyncMock(return_value={"version": version})
+        neo4j_service.driver = self._driver_with_session(session)
+
+        await neo4j_service._detect_vector_functions()
+
+        assert neo4j_service._brute_force_supported is supported
+
+    @pytest.mark.asyncio
+    async def test_search_skips_count_without_vector_functions(self, neo4j_service):
+        """Test no candidate count runs when the exact scan is unavailable."""
+        result = MagicMock()
+        result.__aiter__.return_value = []
+        session = AsyncMock()
+        session.run.return_value = result
+        neo4j_service.driver = self._driver_with_session(session)
+        neo4j_service._estimate_partition_size = AsyncMock(return_value=10)
+
+        await neo4j_service.search_similar_memories(query_vector=[0.1] * 768)
+
+        neo4j_service._estimate_partition_size.assert_not_awaited()
+        assert "db.index.vector.queryNodes" in session.run.call_args.args[0]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("error", "still_supported"),
+        [
+            (
+                Neo4jError._hydrate_neo4j(
+                    code="Neo.ClientError.Statement.SyntaxError",
+                    message="Unknown function 'vector.similarity.cosine'",
+                ),
+                False,
+            ),
+            (
+                Neo4jError._hydrate_neo4j(
+                    code="Neo.TransientError.Transaction.Terminated",
+                    message="Transaction terminated",
+                ),
+                True,
+            ),
+        ],
+    )
+    async def test_brute_force_disabled_only_on_unknown_function(
+        self, neo4j_service, error, still_supported
+    ):
+        """Test a failed exact scan falls back to HNSW and only sticks for missing functions."""
+        hnsw_result = MagicMock()
+        hnsw_result.__aiter__.return_value = []
+        session = AsyncMock()
+        session.run.side_effect = [error, hnsw_result]
+        neo4j_service.driver = self._driver_with_session(session)
+        neo4j_service._brute_force_supported = True
+
+        records = await neo4j_service.search_similar_memories(
+            query_vector=[0.1] * 768, size_hint=10
+        )
+
+        assert records == []
+        assert "vector.similarity.cosine" in session.run.call_args_list[0].args[0]
+        assert "db.index.vector.queryNodes" in session.run.call_args_list[1].args[0]
+        assert neo4j_service._brute_force_supported is still_supported
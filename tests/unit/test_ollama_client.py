@@ -4,6 +4,8 @@ Tests the HTTP client for generating embeddings via Ollama API.
 All tests use mocked httpx responses to avoid external dependencies.
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch
 import httpx
@@ -36,7 +38,7 @@ async def test_embed_single_text_success(ollama_client, mock_embedding_response)
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_embedding_response
+        mock_response.content = json.dumps(mock_embedding_response).encode()
         mock_response.raise_for_status = AsyncMock()
         mock_post.return_value = mock_response
 
@@ -62,7 +64,7 @@ async def test_embed_batch_success(ollama_client, mock_embedding_response):
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = batch_response
+        mock_response.content = json.dumps(batch_response).encode()
         mock_response.raise_for_status = AsyncMock()
         mock_post.return_value = mock_response
 
@@ -156,11 +158,13 @@ async def test_embed_retry_logic(ollama_client):
 
         mock_response_success = AsyncMock()
         mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {
-            "model": "nomic-embed-text",
-            "embeddings": [[0.01] * 768],
-            "total_duration": 14143917,
-        }
+        mock_response_success.content = json.dumps(
+            {
+                "model": "nomic-embed-text",
+                "embeddings": [[0.01] * 768],
+                "total_duration": 14143917,
+            }
+        ).encode()
         mock_response_success.raise_for_status = AsyncMock()
 
         mock_post.side_effect = [
@@ -199,7 +203,7 @@ async def test_embed_dimensions_mismatch(ollama_client):
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = invalid_response
+        mock_response.content = json.dumps(invalid_response).encode()
         mock_response.raise_for_status = AsyncMock()
         mock_post.return_value = mock_response
 
@@ -216,7 +220,7 @@ async def test_embed_latency_tracking(ollama_client, mock_embedding_response):
     with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_embedding_response
+        mock_response.content = json.dumps(mock_embedding_response).encode()
         mock_response.raise_for_status = AsyncMock()
         mock_post.return_value = mock_response
 
@@ -225,3 +229,42 @@ async def test_embed_latency_tracking(ollama_client, mock_embedding_response):
         # Verify latency was calculated (from total_duration in nanoseconds)
         expected_latency_ms = mock_embedding_response["total_duration"] / 1_000_000
         assert expected_latency_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_context_manager_initializes_client():
+    """Test that entering the context eagerly creates the HTTP client."""
+    client = OllamaClient(base_url="http://localhost:11434", model="nomic-embed-text")
+
+    with pytest.raises(RuntimeError):
+        client._client_or_raise()
+
+    async with client as entered:
+        assert entered is client
+        assert client._client_or_raise() is client._client
+
+    assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_warmup_loads_model(ollama_client, mock_embedding_response):
+    """Test warmup sends one embed request."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(mock_embedding_response).encode()
+        mock_response.raise_for_status = AsyncMock()
+        mock_post.return_value = mock_response
+
+        assert await ollama_client.warmup() is True
+
+        assert mock_post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_warmup_failure_returns_false(ollama_client):
+    """Test warmup swallows errors so startup can continue."""
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = httpx.ConnectError("Connection refused")
+
+        assert await ollama_client.warmup() is False
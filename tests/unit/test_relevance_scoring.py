@@ -9,12 +9,15 @@ These tests verify:
 - Score calculation edge cases
 """
 
+import re
+
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 from haia.embedding.retrieval_service import RetrievalService
 from haia.extraction.models import ExtractedMemory
+from haia.services.neo4j import Neo4jService
 
 
 @pytest.fixture
@@ -325,3 +328,41 @@ def test_recency_decay_formula_consistency(retrieval_service):
 
     # Due to exponential decay, earlier decay is faster
     assert decay_first_10 > decay_second_10
+
+
+def test_batch_relevance_scores_match_scalar(retrieval_service, sample_memory):
+    """Test that vectorized batch scoring matches the per-memory formula."""
+    old_mem = ExtractedMemory(
+        memory_id="old",
+        memory_type="personal_fact",
+        content="Old fact",
+        confidence=0.6,
+        source_conversation_id="test_conv",
+        extraction_timestamp=datetime.now(timezone.utc) - timedelta(days=60),
+    )
+    no_ts_mem = ExtractedMemory(
+        memory_id="no_ts",
+        memory_type="decision",
+        content="Undated decision",
+        confidence=0.7,
+        source_conversation_id="test_conv",
+    )
+    memories = [sample_memory, old_mem, no_ts_mem]
+    similarities = [0.9, 0.5, 0.4]
+
+    now = datetime.now(timezone.utc)
+
+    batch_scores = retrieval_service._calculate_relevance_scores(memories, similarities, now)
+
+    for memory, similarity, batch_score in zip(memories, similarities, batch_scores):
+        expected = retrieval_service._calculate_relevance_score(memory, similarity, now)
+        assert batch_score == pytest.approx(expected, abs=1e-9)
+
+
+def test_cypher_relevance_reads_service_params(retrieval_service):
+    """Test the Cypher scorer takes every weight and constant from _relevance_params."""
+    query = Neo4jService._build_search_query(False, None, rank_by_relevance=True)
+
+    used = set(re.findall(r"\$relevance\.(\w+)", query))
+
+    assert used == set(retrieval_service._relevance_params)
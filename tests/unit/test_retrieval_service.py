@@ -4,12 +4,19 @@ Tests semantic search, ranking algorithms, and relevance scoring.
 All tests use mocked Neo4j and Ollama dependencies.
 """
 
+import asyncio
+import logging
+import sqlite3
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
+from datetime import datetime, timezone
 
+from haia.embedding.cache import EmbeddingCache
+from haia.embedding import retrieval_service as retrieval_service_module
 from haia.embedding.retrieval_service import RetrievalService
 from haia.embedding.models import (
+    EmbeddingException,
     RetrievalQuery,
     RetrievalResponse,
     RetrievalResult,
@@ -23,6 +30,8 @@ def mock_neo4j_service():
     """Mock Neo4j service for testing."""
     service = AsyncMock()
     service.search_similar_memories = AsyncMock()
+    service.warmup_search = AsyncMock(return_value=None)
+    service.exact_search_enabled = True
     return service
 
 
@@ -110,6 +119,96 @@ async def test_retrieve_basic_query(retrieval_service, mock_neo4j_service, sampl
     assert response.embedding_latency_ms > 0
 
 
+@pytest.mark.asyncio
+async def test_retrieve_tracks_access_in_background(
+    retrieval_service, mock_neo4j_service, sample_memories
+):
+    """Test access tracking is scheduled without blocking the response."""
+    mock_neo4j_service.search_similar_memories.return_value = sample_memories
+    retrieval_service.access_tracker.buffer_access = AsyncMock(return_value=0)
+
+    query = RetrievalQuery(query_text="Docker preferences", top_k=10)
+    response = await retrieval_service.retrieve(query)
+    await asyncio.sleep(0)  # Let the background task run
+
+    retrieval_service.access_tracker.buffer_access.assert_awaited_once_with(
+        [r.memory.memory_id for r in response.results]
+    )
+
+
+@pytest.mark.asyncio
+async def test_retrieve_prefetches_access_metadata_before_dedup(
+    retrieval_service, mock_neo4j_service, sample_memories
+):
+    """Test access metadata is requested for all candidates, then attached to survivors."""
+    duplicate = {**sample_memories[0], "memory_id": "mem_dup"}
+    mock_neo4j_service.search_similar_memories.return_value = sample_memories + [duplicate]
+    retrieval_service.access_tracker.get_access_metadata = AsyncMock(return_value={})
+
+    query = RetrievalQuery(query_text="Docker preferences", top_k=10)
+    await retrieval_service.retrieve(query)
+
+    retrieval_service.access_tracker.get_access_metadata.assert_awaited_once_with(
+        [m["memory_id"] for m in sample_memories] + ["mem_dup"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_retrieve_skips_malformed_rows(
+    retrieval_service, mock_neo4j_service, sample_memories
+):
+    """Test malformed rows are dropped without failing the query."""
+    missing_content = {k: v for k, v in sample_memories[0].items() if k != "content"}
+    missing_content["memory_id"] = "mem_missing"
+    low_confidence = {**sample_memories[1], "memory_id": "mem_invalid", "confidence": 0.1}
+    mock_neo4j_service.search_similar_memories.return_value = sample_memories + [
+        missing_content,
+        low_confidence,
+    ]
+
+    query = RetrievalQuery(query_text="Docker preferences", top_k=10)
+    response = await retrieval_service.retrieve(query, enable_dedup=False)
+
+    returned_ids = {r.memory.memory_id for r in response.results}
+    assert returned_ids == {m["memory_id"] for m in sample_memories}
+
+
+def test_dict_to_memory_parses_epoch_millis(sample_memories):
+    """Test epoch-millisecond timestamps from the search query become UTC datetimes."""
+    row = {
+        **sample_memories[0],
+        "extraction_timestamp": 1735732800000,
+        "embedding_updated_at": None,
+    }
+
+    memory = RetrievalService._dict_to_memory(row)
+
+    assert memory.extraction_timestamp == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert memory.embedding_updated_at is None
+
+
+@pytest.mark.asyncio
+async def test_retrieve_skips_bad_similarity_scores(
+    retrieval_service, mock_neo4j_service, sample_memories, caplog
+):
+    """Test None and out-of-range similarity scores are dropped, not raised."""
+    none_score = {**sample_memories[0], "memory_id": "mem_none", "similarity_score": None}
+    high_score = {**sample_memories[1], "memory_id": "mem_high", "similarity_score": 1.5}
+    mock_neo4j_service.search_similar_memories.return_value = sample_memories + [
+        none_score,
+        high_score,
+    ]
+
+    query = RetrievalQuery(query_text="Docker preferences", top_k=10)
+    with caplog.at_level(logging.WARNING):
+        response = await retrieval_service.retrieve(query, enable_dedup=False)
+
+    returned_ids = {r.memory.memory_id for r in response.results}
+    assert returned_ids == {m["memory_id"] for m in sample_memories}
+    assert "0 missing fields" in caplog.text
+    assert "2 with a non-numeric or out-of-range similarity score" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_retrieve_empty_results(retrieval_service, mock_neo4j_service):
     """Test retrieval with no matching memories."""
@@ -201,6 +300,47 @@ async def test_memory_type_filtering(retrieval_service, mock_neo4j_service, samp
     assert call_kwargs["memory_types"] == ["preference"]
 
 
+@pytest.mark.asyncio
+async def test_retrieve_warms_up_search_during_embedding(
+    retrieval_service, mock_neo4j_service, sample_memories
+):
+    """Test the candidate count runs alongside embedding and feeds size_hint."""
+    mock_neo4j_service.search_similar_memories.return_value = sample_memories
+    mock_neo4j_service.warmup_search.return_value = 42
+
+    await retrieval_service.retrieve(
+        RetrievalQuery(query_text="Test query", memory_types=["preference"], min_confidence=0.6)
+    )
+
+    mock_neo4j_service.warmup_search.assert_awaited_once_with(["preference"], 0.6)
+    call_kwargs = mock_neo4j_service.search_similar_memories.call_args.kwargs
+    assert call_kwargs["size_hint"] == 42
+
+    # A precomputed embedding leaves the count to the search itself
+    mock_neo4j_service.warmup_search.reset_mock()
+    await retrieval_service.retrieve(
+        RetrievalQuery(query_text="Test query", query_embedding=[0.01] * 768)
+    )
+    mock_neo4j_service.warmup_search.assert_not_awaited()
+    call_kwargs = mock_neo4j_service.search_similar_memories.call_args.kwargs
+    assert call_kwargs["size_hint"] is None
+
+
+@pytest.mark.asyncio
+async def test_retrieve_skips_warmup_without_exact_search(
+    retrieval_service, mock_neo4j_service, sample_memories
+):
+    """Test no candidate count is scheduled when Neo4j can't run the exact scan."""
+    mock_neo4j_service.search_similar_memories.return_value = sample_memories
+    mock_neo4j_service.exact_search_enabled = False
+
+    await retrieval_service.retrieve(RetrievalQuery(query_text="Test query"))
+
+    mock_neo4j_service.warmup_search.assert_not_called()
+    call_kwargs = mock_neo4j_service.search_similar_memories.call_args.kwargs
+    assert call_kwargs["size_hint"] is None
+
+
 @pytest.mark.asyncio
 async def test_generate_embedding(retrieval_service, mock_ollama_client):
     """Test embedding generation for query text."""
@@ -213,6 +353,107 @@ async def test_generate_embedding(retrieval_service, mock_ollama_client):
     mock_ollama_client.embed.assert_called_once_with("Test query")
 
 
+@pytest.mark.asyncio
+async def test_generate_embedding_cached(retrieval_service, mock_ollama_client):
+    """Test repeated query texts are served from the embedding cache."""
+    first = await retrieval_service.generate_embedding("Test query")
+    first.append(1.0)  # Mutating the result must not corrupt the cache
+    second = await retrieval_service.generate_embedding("Test query")
+
+    assert len(second) == 768
+    mock_ollama_client.embed.assert_called_once_with("Test query")
+    assert retrieval_service.cache_hits == 1
+    assert retrieval_service.cache_misses == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_embeddings_batch_coalesces_misses(
+    retrieval_service, mock_ollama_client
+):
+    """Test concurrent cache misses are sent to Ollama as one batch."""
+    mock_ollama_client.embed_batch = AsyncMock(
+        side_effect=lambda texts: [[float(i)] * 768 for i in range(len(texts))]
+    )
+
+    embeddings = await retrieval_service.generate_embeddings_batch(
+        ["first query", "second query", "first query"]
+    )
+
+    assert len(embeddings) == 3
+    assert embeddings[0] == embeddings[2]
+    mock_ollama_client.embed_batch.assert_awaited_once_with(["first query", "second query"])
+    mock_ollama_client.embed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_short_embed_batch_fails_every_waiter(retrieval_service, mock_ollama_client):
+    """Test a batch with fewer vectors than texts fails callers instead of hanging."""
+    mock_ollama_client.embed_batch = AsyncMock(return_value=[[0.1] * 768])
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            retrieval_service.generate_embedding("first query"),
+            retrieval_service.generate_embedding("second query"),
+            return_exceptions=True,
+        ),
+        timeout=1.0,
+    )
+
+    assert all(isinstance(r, EmbeddingException) for r in results)
+    assert retrieval_service._pending_embeds == {}
+
+@pytest.mark.asyncio
+async def test_cancelled_embed_flush_releases_waiters(retrieval_service, mock_ollama_client):
+    """Test callers don't hang when the shared embedding flush is cancelled."""
+    started = asyncio.Event()
+
+    async def hang(text):
+        started.set()
+        await asyncio.Event().wait()
+
+    mock_ollama_client.embed = AsyncMock(side_effect=hang)
+
+    caller = asyncio.create_task(retrieval_service.generate_embedding("Test query"))
+    await started.wait()
+    flush_task = next(
+        task for task in retrieval_service_module._background_tasks if not task.done()
+    )
+    flush_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(caller, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_generate_embedding_persistent_cache(
+    mock_neo4j_service, mock_ollama_client, tmp_path
+):
+    """Test query embeddings persist across service instances."""
+    cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+    service = RetrievalService(
+        neo4j_service=mock_neo4j_service,
+        ollama_client=mock_ollama_client,
+        embedding_cache=cache,
+    )
+    await service.generate_embedding("Test query")
+
+    restarted = RetrievalService(
+        neo4j_service=mock_neo4j_service,
+        ollama_client=mock_ollama_client,
+        embedding_cache=cache,
+    )
+    embedding = await restarted.generate_embedding("Test query")
+
+    assert len(embedding) == 768
+    mock_ollama_client.embed.assert_called_once_with("Test query")
+    assert restarted.cache_hits == 1
+
+    # Closing the service also closes the persistent cache
+    await restarted.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        len(cache)
+
+
 @pytest.mark.asyncio
 async def test_deduplication(retrieval_service, mock_neo4j_service):
     """Test deduplication of near-duplicate memories."""